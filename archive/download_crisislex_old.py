@@ -26,45 +26,19 @@ Date: January 2026
 import pandas as pd
 import requests
 import os
+import sys
 
-base_url = "https://raw.githubusercontent.com/sajao/CrisisLex/master/data/CrisisLexT26/"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'phase1_download'))
+from _events import CRISISLEX_T26_EVENTS  # All 26 events
 
-# All 26 events
-events = [
-    '2012_Colorado_wildfires',
-    '2012_Costa_Rica_earthquake',
-    '2012_Guatemala_earthquake',
-    '2012_Italy_earthquakes',
-    '2012_Philipinnes_floods',
-    '2012_Typhoon_Pablo',
-    '2012_Venezuela_refinery',
-    '2013_Alberta_floods',
-    '2013_Australia_bushfire',
-    '2013_Bohol_earthquake',
-    '2013_Boston_bombings',
-    '2013_Brazil_nightclub_fire',
-    '2013_Colorado_floods',
-    '2013_LAX_shootings',
-    '2013_Manila_floods',
-    '2013_NY_train_crash',
-    '2013_Oklahoma_tornadoes',
-    '2013_Queensland_floods',
-    '2013_Sardinia_floods',
-    '2013_Savar_building_collapse',
-    '2013_Singapore_haze',
-    '2013_Spain_train_crash',
-    '2013_Typhoon_Yolanda',
-    '2013_West_Texas_explosion',
-    '2012_Hurricane_Sandy',
-    '2013_Russia_meteorite'
-]
+base_url = "https://raw.githubusercontent.com/sajao/CrisisLex/master/data/CrisisLexT26/"
 
 os.makedirs('crisislex_data', exist_ok=True)
 
 all_tweets = []
 successful_downloads = 0
 
-for event in events:
+for event in CRISISLEX_T26_EVENTS:
     url = f"{base_url}{event}/{event}-tweets_labeled.csv"
     print(f"Downloading {event}...")
 
@@ -30,8 +30,7 @@ print(f"\nDate range: {df['created_at'].min()} to {df['created_at'].max()}")
 
 # Show hourly distribution
 df['created_at'] = pd.to_datetime(df['created_at'])
-df['hour'] = df['created_at'].dt.floor('H')
-hourly = df.groupby('hour').size()
+hourly = df['created_at'].dt.floor('h').value_counts(sort=False).sort_index()
 
 print(f"\nTweets per hour (first 10 hours):")
 print(hourly.head(10))
@@ -0,0 +1,18 @@
+"""
+Shared helpers for the phase scripts
+
+Each script runs directly (python scripts/phaseX_.../script.py), so it adds
+this scripts/ folder to sys.path before importing from here.
+"""
+
+import os
+
+
+def iter_files(root, suffix):
+    """Recursively yield paths under root ending with suffix (os.scandir, no stat calls)"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path, suffix)
+            elif entry.name.endswith(suffix):
+                yield entry.path
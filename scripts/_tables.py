@@ -0,0 +1,60 @@
+"""
+Shared table helpers for the phase scripts and utils/ checks
+
+Kept apart from _common.py so the download scripts that only walk folders
+do not need pandas. Scripts add this scripts/ folder to sys.path before
+importing from here.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+def prefer_parquet(csv_path):
+    """Return the Parquet sibling of csv_path if one exists, else csv_path"""
+    parquet_path = Path(csv_path).with_suffix('.parquet')
+    return str(parquet_path) if parquet_path.exists() else csv_path
+
+
+def read_table(path, columns=None, **csv_kwargs):
+    """Load a .parquet or .csv file into a DataFrame, reading only `columns` (those present) if given"""
+    if path.endswith('.parquet'):
+        if columns is not None:
+            present = pq.read_schema(path).names
+            columns = [c for c in columns if c in present]
+        return pd.read_parquet(path, columns=columns)
+    if columns is not None:
+        present = pd.read_csv(path, nrows=0).columns
+        columns = [c for c in columns if c in present]
+    return pd.read_csv(path, usecols=columns, **csv_kwargs)
+
+
+def unify_categories(frames, columns):
+    """Give every frame the same categories per column so concat keeps category dtype"""
+    for col in columns:
+        parts = [frame[col].astype('category') for frame in frames if col in frame]
+        if not parts:
+            continue
+        # Categories can arrive as str (Parquet), string[pyarrow] (Arrow CSV) or
+        # object (all-null columns), which union_categoricals refuses to mix,
+        # so they are unioned as one str index in order of first appearance
+        categories = pd.Index([], dtype=str).append([part.cat.categories.astype(str) for part in parts])
+        dtype = pd.CategoricalDtype(categories.unique())
+        for frame in frames:
+            if col in frame:
+                frame[col] = frame[col].astype(dtype)
+    return frames
+
+
+def format_timestamps(timestamps):
+    """Format a datetime64 Series as uniform 'YYYY-MM-DD HH:MM:SS' strings (for CSV output)"""
+    # Truncate to whole seconds in numpy and let Arrow's cast print them in C
+    # (same text as dt.strftime, without a Python call per row)
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_localize(None)  # keep the wall time, like strftime
+    seconds = timestamps.to_numpy().astype('datetime64[s]')
+    text = pa.array(seconds, from_pandas=True).cast(pa.string())
+    return pd.Series(pd.arrays.ArrowExtensionArray(text), index=timestamps.index)
@@ -0,0 +1,17 @@
+"""
+Shared file preview helper
+
+Imported by download_baseline.py and download_humaid.py to show the first
+rows of a downloaded file without reading all of it.
+"""
+
+import csv
+import itertools
+
+
+def peek_rows(path, n_rows, delimiter=',', encoding='utf-8', block_size=4096):
+    """Parse the first n_rows lines from a single raw block of the file"""
+    with open(path, 'rb') as f:
+        head = f.read(block_size).decode(encoding, errors='replace')
+    lines = head.split('\n')[:-1]  # last piece may be a cut-off line
+    return list(itertools.islice(csv.reader(lines, delimiter=delimiter), n_rows))
@@ -29,10 +29,29 @@ Date: January 2026
 ================================================================================
 """
 
+import mmap
 import subprocess
 import zipfile
 import os
 
+from _peek import peek_rows
+
+
+def count_lines(path, bufsize=1 << 24):
+    """
+    Count lines by scanning the memory-mapped file with bytes.count (memchr),
+    16 MiB at a time. MADV_SEQUENTIAL tells the kernel to read ahead aggressively.
+    """
+    if os.path.getsize(path) == 0:
+        return 0
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        lines = sum(mm[i:i + bufsize].count(b'\n') for i in range(0, len(mm), bufsize))
+        # A final line without a trailing newline still counts
+        return lines + (mm[-1:] != b'\n')
+
+
 print("="*70)
 print("DOWNLOADING SENTIMENT140 - BASELINE TWEETS")
 print("="*70)
@@ -63,25 +82,20 @@ if result.returncode == 0:
         print(f"\nExtracted files: {files}")
 
         # Check the CSV
-        import pandas as pd
         csv_files = [f for f in files if f.endswith('.csv')]
         if csv_files:
             print(f"\nExamining {csv_files[0]}...")
-            df = pd.read_csv(
-                csv_files[0],
-                encoding='latin-1',  # Sentiment140 uses latin-1
-                nrows=10,
-                header=None,  # No header row
-                names=['sentiment', 'id', 'date', 'query', 'user', 'text']
-            )
-
-            print(f"\nColumns (inferred): {df.columns.tolist()}")
+            columns = ['sentiment', 'id', 'date', 'query', 'user', 'text']  # No header row
+            rows = peek_rows(csv_files[0], 10, encoding='latin-1')  # Sentiment140 uses latin-1
+
+            print(f"\nColumns (inferred): {columns}")
             print(f"\nFirst tweet:")
-            print(df.iloc[0])
+            for name, value in zip(columns, rows[0]):
+                print(f"  {name}: {value}")
 
             # Count total rows
             print(f"\nCounting total rows...")
-            full_count = sum(1 for _ in open(csv_files[0], encoding='latin-1'))
+            full_count = count_lines(csv_files[0])
             print(f"Total baseline tweets: {full_count:,}")
 
 else:
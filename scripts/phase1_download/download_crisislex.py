@@ -11,8 +11,9 @@ Purpose:
     - Includes informativeness labels (Related-Informative, Not Related, etc.)
 
 Output:
-    - crisis_datasets/crisislex_complete/ (individual event CSVs)
+    - crisis_datasets/crisislex_complete/ (individual event Parquet files)
     - crisis_datasets/crisislex_all_complete.csv (combined file)
+    - crisis_datasets/crisislex_all_complete.parquet (same data, typed columns)
 
 Events Included (26 total):
     - 2012 Colorado Wildfires, Hurricane Sandy
@@ -28,121 +29,236 @@ Usage:
 Note:
     This version merges labeled tweets WITH timestamps from the tweet-IDs file.
     The older version (download_crisislex_old.py) didn't include timestamps.
+    Events are downloaded in parallel (MAX_WORKERS threads sharing one
+    requests.Session), so per-event output may appear out of order.
+    Each event is merged, tagged and timestamped as one Arrow table.
+    Re-runs reuse crisis_datasets/crisislex_complete/*_complete.parquet: files
+    younger than CACHE_TTL_SECONDS are used directly, older ones are only
+    re-downloaded when the remote ETag (stored in a .etag sidecar) changed.
 
 Author: JIKI DAP Round 2 Team
 Date: January 2026
 ================================================================================
 """
 
-import pandas as pd
-import requests
+import io
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-base_url = "https://raw.githubusercontent.com/sajao/CrisisLex/master/data/CrisisLexT26/"
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-events = [
-    '2012_Colorado_wildfires',
-    '2012_Costa_Rica_earthquake',
-    '2012_Guatemala_earthquake',
-    '2012_Italy_earthquakes',
-    '2012_Philipinnes_floods',
-    '2012_Typhoon_Pablo',
-    '2012_Venezuela_refinery',
-    '2013_Alberta_floods',
-    '2013_Australia_bushfire',
-    '2013_Bohol_earthquake',
-    '2013_Boston_bombings',
-    '2013_Brazil_nightclub_fire',
-    '2013_Colorado_floods',
-    '2013_LAX_shootings',
-    '2013_Manila_floods',
-    '2013_NY_train_crash',
-    '2013_Oklahoma_tornadoes',
-    '2013_Queensland_floods',
-    '2013_Sardinia_floods',
-    '2013_Savar_building_collapse',
-    '2013_Singapore_haze',
-    '2013_Spain_train_crash',
-    '2013_Typhoon_Yolanda',
-    '2013_West_Texas_explosion',
-    '2012_Hurricane_Sandy',
-    '2013_Russia_meteorite'
-]
+from _events import CRISISLEX_T26_EVENTS
 
-os.makedirs('crisis_datasets/crisislex_complete', exist_ok=True)
+MAX_WORKERS = 16
 
-all_events = []
-successful = 0
-failed = 0
+# Saved events younger than this are reused as-is; older ones are only
+# re-downloaded if the remote ETags changed
+CACHE_TTL_SECONDS = 7 * 24 * 3600
 
-for event in events:
-    print(f"\n{'='*60}")
-    print(f"Processing: {event}")
-    print('='*60)
+# Layout of the tweet-IDs file timestamps; anything else falls back to pandas
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
 
-    try:
-        # Download File 1: Labeled tweets (text + labels)
-        url_labeled = f"{base_url}{event}/{event}-tweets_labeled.csv"
-        print(f"Downloading labeled tweets...")
-        df_labeled = pd.read_csv(url_labeled, encoding='utf-8', low_memory=False)
-        print(f"  {len(df_labeled)} labeled tweets")
+base_url = "https://raw.githubusercontent.com/sajao/CrisisLex/master/data/CrisisLexT26/"
 
-        # Download File 2: Tweet IDs with timestamps
-        url_ids = f"{base_url}{event}/{event}-tweetids_entire_period.csv"
-        print(f"Downloading tweet IDs with timestamps...")
-        df_ids = pd.read_csv(url_ids, encoding='utf-8', low_memory=False)
-        print(f"  {len(df_ids)} tweet IDs with timestamps")
+os.makedirs('crisis_datasets/crisislex_complete', exist_ok=True)
 
-        # Show columns
-        print(f"\nLabeled file columns: {df_labeled.columns.tolist()}")
-        print(f"IDs file columns: {df_ids.columns.tolist()}")
+# One shared session so the 52 GETs reuse pooled HTTPS connections
+session = requests.Session()
+adapter = HTTPAdapter(
+    pool_connections=MAX_WORKERS,
+    pool_maxsize=MAX_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.5)
+)
+session.mount('https://', adapter)
 
-        # Clean column names (remove extra spaces)
-        df_labeled.columns = df_labeled.columns.str.strip()
-        df_ids.columns = df_ids.columns.str.strip()
 
-        # Find the tweet ID column name (might have different names)
-        id_col_labeled = [col for col in df_labeled.columns if 'id' in col.lower()][0]
-        id_col_ids = [col for col in df_ids.columns if 'id' in col.lower()][0]
+def download(url):
+    """Download a CSV through the shared session"""
+    response = session.get(url, timeout=60)
+    response.raise_for_status()
+    return response
 
-        print(f"\nMerging on: {id_col_labeled} (labeled) <-> {id_col_ids} (ids)")
 
-        # Merge on tweet ID
-        df_merged = df_labeled.merge(
-            df_ids,
-            left_on=id_col_labeled,
-            right_on=id_col_ids,
-            how='inner'  # Only keep tweets that have both text AND timestamp
-        )
+def load_cached_event(output_file, urls):
+    """Return the saved event table if it is still valid, else None"""
+    if not os.path.exists(output_file):
+        return None
 
-        print(f"  Merged: {len(df_merged)} tweets with BOTH text and timestamps")
+    if time.time() - os.path.getmtime(output_file) > CACHE_TTL_SECONDS:
+        etag_file = output_file + '.etag'
+        if not os.path.exists(etag_file):
+            return None
+        with open(etag_file) as f:
+            stored = f.read().splitlines()
+        remote = [session.head(url, timeout=30).headers.get('ETag') for url in urls]
+        if remote != stored:
+            return None
+        os.utime(output_file)  # unchanged remotely, trust it for another TTL
 
-        # Add metadata
-        df_merged['event_name'] = event
-        df_merged['source_dataset'] = 'CrisisLexT26'
-        df_merged['crisis_label'] = 1
+    return pq.read_table(output_file)
 
-        # Check for timestamp column
-        timestamp_col = [col for col in df_merged.columns if 'time' in col.lower()][0]
-        print(f"  Timestamp column: {timestamp_col}")
 
-        # Convert timestamp
-        df_merged['created_at'] = pd.to_datetime(df_merged[timestamp_col])
+def parse_timestamps(column):
+    """Parse an Arrow string column into UTC timestamps"""
+    try:
+        return pc.strptime(column, format=TIMESTAMP_FORMAT, unit='s').cast(pa.timestamp('s', tz='UTC'))
+    except pa.ArrowInvalid:
+        values = column.to_pandas()
+        try:
+            parsed = pd.to_datetime(values, format='ISO8601', utc=True, cache=True)
+        except ValueError:
+            parsed = pd.to_datetime(values, format='mixed', utc=True, cache=True)
+        return pa.array(parsed)
+
+
+def constant_column(value, n_rows):
+    """Dictionary-encoded column repeating one string (stored once)"""
+    return pa.DictionaryArray.from_arrays(pa.array(np.zeros(n_rows, dtype=np.int8)), pa.array([value]))
+
+
+def read_columns(csv_bytes, pick_columns):
+    """
+    Parse only the columns we need from a downloaded CSV.
+    The header is probed first (nrows=0) so pick_columns can choose from the
+    stripped column names; the pyarrow engine then reads everything as
+    Arrow-backed strings and the tweet ID column (the first returned by
+    pick_columns) is cast to nullable Int64 so the merge hashes integers
+    instead of Python strings.
+    """
+    header = pd.read_csv(io.BytesIO(csv_bytes), nrows=0).columns
+    raw_names = {col.strip(): col for col in header}
+    wanted = pick_columns(list(raw_names))
+
+    df = pd.read_csv(
+        io.BytesIO(csv_bytes),
+        usecols=[raw_names[col] for col in wanted],
+        dtype=pd.ArrowDtype(pa.string()),
+        engine='pyarrow',
+        dtype_backend='pyarrow'
+    )
+    df.columns = df.columns.str.strip()
+
+    # Tweet IDs are stored quoted (e.g. '348351014127833088')
+    id_col = wanted[0]
+    df[id_col] = pd.to_numeric(
+        df[id_col].str.strip(" '\""), errors='coerce', dtype_backend='numpy_nullable'
+    )
+    return df[wanted]
+
+
+def labeled_columns(columns):
+    """Tweet ID, text and informativeness label columns of the labeled file"""
+    id_col = [col for col in columns if 'id' in col.lower()][0]
+    text_col = [col for col in columns if 'text' in col.lower()][0]
+    label_col = [col for col in columns if 'informativeness' in col.lower()][0]
+    return [id_col, text_col, label_col]
+
+
+def id_file_columns(columns):
+    """Tweet ID and timestamp columns of the tweet-IDs file"""
+    id_col = [col for col in columns if 'id' in col.lower()][0]
+    time_col = [col for col in columns if 'time' in col.lower()][0]
+    return [id_col, time_col]
+
+
+def fetch_event(event):
+    """Download, merge and save the labeled tweets + timestamps for one event"""
+    url_labeled = f"{base_url}{event}/{event}-tweets_labeled.csv"
+    url_ids = f"{base_url}{event}/{event}-tweetids_entire_period.csv"
+    output_file = f'crisis_datasets/crisislex_complete/{event}_complete.parquet'
+
+    # Reuse the file saved by a previous run when possible
+    cached = load_cached_event(output_file, [url_labeled, url_ids])
+    if cached is not None:
+        print(f"\n  {event}: using cached {output_file} ({cached.num_rows} tweets)")
+        return cached
+
+    # Download File 1: Labeled tweets (text + labels)
+    response_labeled = download(url_labeled)
+    df_labeled = read_columns(response_labeled.content, labeled_columns)
+
+    # Download File 2: Tweet IDs with timestamps
+    response_ids = download(url_ids)
+    df_ids = read_columns(response_ids.content, id_file_columns)
+
+    id_col_labeled = df_labeled.columns[0]
+    id_col_ids, timestamp_col = df_ids.columns
+
+    # From here on everything stays in Arrow
+    labeled = pa.Table.from_pandas(df_labeled, preserve_index=False)
+    ids = pa.Table.from_pandas(df_ids, preserve_index=False)
+    labeled = labeled.append_column('_row', pa.array(np.arange(labeled.num_rows)))
+
+    # Merge on tweet ID (hash join does not keep row order, so restore it)
+    merged = labeled.join(
+        ids,
+        keys=id_col_labeled,
+        right_keys=id_col_ids,
+        join_type='inner'  # Only keep tweets that have both text AND timestamp
+    ).sort_by('_row').drop_columns(['_row'])
+
+    # Add metadata and the parsed timestamp
+    n_rows = merged.num_rows
+    merged = (
+        merged
+        .append_column('event_name', constant_column(event, n_rows))
+        .append_column('source_dataset', constant_column('CrisisLexT26', n_rows))
+        .append_column('crisis_label', pa.array(np.ones(n_rows, dtype=np.int64)))
+        .append_column('created_at', parse_timestamps(merged.column(timestamp_col)))
+    )
+
+    # Save, recording the remote ETags for later freshness checks
+    pq.write_table(merged, output_file, compression='snappy')
+    etags = [response_labeled.headers.get('ETag'), response_ids.headers.get('ETag')]
+    if None not in etags:
+        with open(output_file + '.etag', 'w') as f:
+            f.write('\n'.join(etags))
+
+    # Threads finish out of order, so print each event's report in one call
+    created_at = merged.column('created_at')
+    print("\n".join([
+        f"\n{'='*60}",
+        f"Processed: {event}",
+        '='*60,
+        f"  {len(df_labeled)} labeled tweets, {len(df_ids)} tweet IDs with timestamps",
+        f"  Merged on: {id_col_labeled} (labeled) <-> {id_col_ids} (ids)",
+        f"  Merged: {n_rows} tweets with BOTH text and timestamps",
+        f"  Timestamp column: {timestamp_col}",
+        f"  Date range: {pc.min(created_at)} to {pc.max(created_at)}",
+        f"  Saved to {output_file}",
+    ]))
+
+    return merged
+
+results = {}
+successful = 0
+failed = 0
 
-        # Show date range
-        print(f"  Date range: {df_merged['created_at'].min()} to {df_merged['created_at'].max()}")
+print(f"Downloading {len(CRISISLEX_T26_EVENTS)} events with {MAX_WORKERS} parallel workers...")
 
-        # Save
-        output_file = f'crisis_datasets/crisislex_complete/{event}_complete.csv'
-        df_merged.to_csv(output_file, index=False)
-        print(f"  Saved to {output_file}")
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    futures = {executor.submit(fetch_event, event): event for event in CRISISLEX_T26_EVENTS}
 
-        all_events.append(df_merged)
-        successful += 1
+    for future in as_completed(futures):
+        event = futures[future]
+        try:
+            results[event] = future.result()
+            successful += 1
+        except Exception as e:
+            print(f"\n  {event} failed: {str(e)[:100]}...")
+            failed += 1
 
-    except Exception as e:
-        print(f"  Failed: {str(e)[:100]}...")
-        failed += 1
+# Keep the combined file in the original event order
+all_events = [results[event] for event in CRISISLEX_T26_EVENTS if event in results]
 
 # Combine all events
 if all_events:
@@ -150,15 +266,17 @@ if all_events:
     print("COMBINING ALL EVENTS")
     print('='*60)
 
-    combined = pd.concat(all_events, ignore_index=True)
-    combined.to_csv('crisis_datasets/crisislex_all_complete.csv', index=False)
+    # Arrow only stitches the per-event chunks together, no row copies
+    combined = pa.concat_tables(all_events, promote_options='permissive')
+    pacsv.write_csv(combined, 'crisis_datasets/crisislex_all_complete.csv')
+    pq.write_table(combined, 'crisis_datasets/crisislex_all_complete.parquet', compression='snappy')
 
     print(f"\nSUCCESS!")
     print(f"Total events downloaded: {successful}/26")
     print(f"Failed: {failed}/26")
-    print(f"Total tweets: {len(combined)}")
-    print(f"Date range: {combined['created_at'].min()} to {combined['created_at'].max()}")
-    print(f"\nSaved to: crisis_datasets/crisislex_all_complete.csv")
+    print(f"Total tweets: {combined.num_rows}")
+    print(f"Date range: {pc.min(combined['created_at'])} to {pc.max(combined['created_at'])}")
+    print(f"\nSaved to: crisis_datasets/crisislex_all_complete.csv (+ .parquet)")
 
 else:
     print("\nNo events downloaded successfully")
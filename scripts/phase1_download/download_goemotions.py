@@ -11,20 +11,23 @@ Purpose:
 
 Output:
     - goemotion_data/goemotions.csv (or goemotions_full.csv)
+    - goemotion_data/goemotions.parquet (labels kept as a list column)
 
 Usage:
     python scripts/phase1_download/download_goemotions.py
 
 Dependencies:
-    pip install datasets pandas
+    pip install datasets pyarrow
 
 Author: JIKI DAP Round 2 Team
 Date: January 2026
 ================================================================================
 """
 
-from datasets import load_dataset
-import pandas as pd
+from datasets import load_dataset, concatenate_datasets
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pacsv
 import os
 
 print("="*70)
@@ -40,23 +43,29 @@ dataset = load_dataset("google-research-datasets/go_emotions", "simplified")
 
 print("Download complete!")
 
-# Convert to pandas
-train_df = pd.DataFrame(dataset['train'])
-val_df = pd.DataFrame(dataset['validation'])
-test_df = pd.DataFrame(dataset['test'])
-
-# Combine all splits
-combined = pd.concat([train_df, val_df, test_df], ignore_index=True)
+# Combine all splits (stays in Arrow, no pandas round-trip)
+combined = concatenate_datasets([dataset['train'], dataset['validation'], dataset['test']])
 
 print(f"\nTotal rows: {len(combined):,}")
-print(f"Columns: {combined.columns.tolist()}")
+print(f"Columns: {combined.column_names}")
 print(f"\nFirst example:")
-print(combined.iloc[0])
+print(combined[0])
+
+# Save Parquet straight from the Arrow table
+parquet_path = 'goemotion_data/goemotions.parquet'
+combined.to_parquet(parquet_path, compression='snappy')
+print(f"\nSaved to: {parquet_path}")
+
+# CSV kept for compatibility: labels written like "[2, 3]" as before
+table = combined.with_format('arrow')[:]
+labels_text = pc.binary_join_element_wise(
+    '[', pc.binary_join(pc.cast(table['labels'], pa.list_(pa.string())), ', '), ']', ''
+)
+table = table.set_column(table.schema.get_field_index('labels'), 'labels', labels_text)
 
-# Save
 output_path = 'goemotion_data/goemotions.csv'
-combined.to_csv(output_path, index=False)
-print(f"\nSaved to: {output_path}")
+pacsv.write_csv(table, output_path)
+print(f"Saved to: {output_path}")
 
 # Show emotion distribution
 print(f"\n{'='*70}")
@@ -64,7 +73,7 @@ print("EMOTION CATEGORIES")
 print('='*70)
 
 # GoEmotions has 27 emotions + neutral
-emotion_cols = [col for col in combined.columns if col not in ['text', 'id']]
+emotion_cols = [col for col in combined.column_names if col not in ['text', 'id']]
 print(f"Available emotions: {emotion_cols[:10]}...")  # Show first 10
 print(f"Total emotion categories: {len(emotion_cols)}")
 
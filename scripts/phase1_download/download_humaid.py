@@ -23,6 +23,9 @@ Events Included:
 Usage:
     python scripts/phase1_download/download_humaid.py
 
+Dependencies:
+    pip install requests
+
 Note:
     This downloads Set 1 (47K tweets). For Set 2 (29K more),
     fill out the form at: https://crisisnlp.qcri.org/humaid_dataset
@@ -35,6 +38,13 @@ Date: January 2026
 import requests
 import tarfile
 import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # scripts/, for _common
+from _common import iter_files
+from _peek import peek_rows
+
 
 # Create directory
 os.makedirs('crisis_datasets/humaid_crisis_data', exist_ok=True)
@@ -44,45 +54,58 @@ print("This is ~76 MB, might take a few minutes...")
 
 url = "https://crisisnlp.qcri.org/data/humaid/HumAID_data_events_set1_47K.tar.gz"
 
-# Download
-response = requests.get(url, stream=True)
-file_path = 'crisis_datasets/humaid_crisis_data/HumAID_set1.tar.gz'
+# 1 MiB reads: ~76 loop iterations for the whole archive instead of ~9700
+CHUNK_SIZE = 1 << 20
 
-with open(file_path, 'wb') as f:
-    total = int(response.headers.get('content-length', 0))
-    downloaded = 0
-    for chunk in response.iter_content(chunk_size=8192):
-        f.write(chunk)
-        downloaded += len(chunk)
-        if total > 0:
-            percent = (downloaded / total) * 100
+
+class ProgressReader:
+    """File-like view of the HTTP body that prints download progress as it is read"""
+
+    def __init__(self, raw, total):
+        self.raw = raw
+        self.total = total
+        self.downloaded = 0
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.downloaded += len(data)
+        if self.total > 0:
+            percent = (self.downloaded / self.total) * 100
             print(f'\rProgress: {percent:.1f}%', end='')
+        return data
+
+
+# Download and extract in one pass: the archive is untarred as it streams in,
+# so the .tar.gz never touches the disk
+print("\nDownloading and extracting files...")
+with requests.get(url, stream=True) as response:
+    response.raise_for_status()
+    response.raw.decode_content = True
+    total = int(response.headers.get('content-length', 0))
+    body = ProgressReader(response.raw, total)
 
-print("\nDownload complete!")
+    with tarfile.open(fileobj=body, mode='r|gz', bufsize=CHUNK_SIZE) as tar:
+        tar.extractall('crisis_datasets/humaid_crisis_data/', filter='data')
 
-# Extract
-print("\nExtracting files...")
-with tarfile.open(file_path, 'r:gz') as tar:
-    tar.extractall('crisis_datasets/humaid_crisis_data/')
-print("Extraction complete!")
+print("\nDownload and extraction complete!")
 
 # List what's inside
 print("\nFiles extracted:")
-for root, dirs, files in os.walk('crisis_datasets/humaid_crisis_data/'):
-    for file in files:
-        if file.endswith('.tsv'):
-            file_path = os.path.join(root, file)
-            print(f"  - {file}")
-
-            # Quick peek at first file
-            import pandas as pd
-            try:
-                df = pd.read_csv(file_path, sep='\t', nrows=5)
-                print(f"    Columns: {df.columns.tolist()}")
-                print(f"    Sample row: {df.iloc[0].to_dict()}")
-                break
-            except:
-                pass
+peeked_dirs = set()
+for file_path in iter_files('crisis_datasets/humaid_crisis_data/', '.tsv'):
+    print(f"  - {os.path.basename(file_path)}")
+
+    # Quick peek at the first file of each folder (one raw block, no DataFrame)
+    folder = os.path.dirname(file_path)
+    if folder in peeked_dirs:
+        continue
+    try:
+        header, *samples = peek_rows(file_path, 6, delimiter='\t')
+        print(f"    Columns: {header}")
+        print(f"    Sample row: {dict(zip(header, samples[0]))}")
+        peeked_dirs.add(folder)
+    except:
+        pass
 
 print("\nHumAID Set 1 ready in 'crisis_datasets/humaid_crisis_data/' folder!")
 print("\nNext step: Run phase2_process/extract_humaid_timestamps.py to get timestamps")
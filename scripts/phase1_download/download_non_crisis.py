@@ -36,9 +36,9 @@ Date: January 2026
 """
 
 import os
-import subprocess
-import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
+from kaggle.api.kaggle_api_extended import KaggleApi
 
 # Create directory for non-crisis data
 os.makedirs('non_crisis_data', exist_ok=True)
@@ -62,67 +62,55 @@ datasets = {
 downloaded = []
 failed = []
 
-# Save current directory
-original_dir = os.getcwd()
-
-for name, dataset_id in datasets.items():
-    print(f"\n{'='*70}")
-    print(f"Downloading: {name}")
-    print(f"Dataset: {dataset_id}")
-    print('='*70)
-
-    try:
-        # Create subfolder for this dataset
-        folder_name = name.lower().replace(' ', '_')
-        folder_path = os.path.join('non_crisis_data', folder_name)
-        os.makedirs(folder_path, exist_ok=True)
-
-        # Change to dataset folder
-        os.chdir(folder_path)
-
-        # Download using Kaggle API
-        result = subprocess.run(
-            ['kaggle', 'datasets', 'download', '-d', dataset_id],
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode == 0:
-            print(f"Downloaded successfully!")
-
-            # Find and extract ZIP file
-            zip_files = [f for f in os.listdir('.') if f.endswith('.zip')]
-            if zip_files:
-                latest_zip = max(zip_files, key=os.path.getctime)
-                print(f"Extracting: {latest_zip}")
-
-                with zipfile.ZipFile(latest_zip, 'r') as zip_ref:
-                    zip_ref.extractall('.')
-
-                # Remove zip file
-                os.remove(latest_zip)
-
-                # List extracted files
-                files = os.listdir('.')
-                print(f"Extracted {len(files)} files:")
-                for f in files[:5]:  # Show first 5
-                    print(f"  - {f}")
-                if len(files) > 5:
-                    print(f"  ... and {len(files)-5} more")
-
-                downloaded.append((name, folder_name))
-
-        else:
-            print(f"Failed: {result.stderr}")
+# Authenticate once; every worker thread shares this client
+api = KaggleApi()
+api.authenticate()
+
+
+def download_dataset(name, dataset_id):
+    """Download and unzip one Kaggle dataset into its own subfolder"""
+    folder_name = name.lower().replace(' ', '_')
+    folder_path = os.path.join('non_crisis_data', folder_name)
+    os.makedirs(folder_path, exist_ok=True)
+
+    # unzip=True extracts in place and removes the archive
+    api.dataset_download_files(dataset_id, path=folder_path, unzip=True)
+
+    files = os.listdir(folder_path)
+    lines = [
+        f"\n{'='*70}",
+        f"Downloaded: {name}",
+        f"Dataset: {dataset_id}",
+        '='*70,
+        f"Extracted {len(files)} files:",
+    ]
+    lines += [f"  - {f}" for f in files[:5]]  # Show first 5
+    if len(files) > 5:
+        lines.append(f"  ... and {len(files)-5} more")
+    print("\n".join(lines))
+
+    return folder_name
+
+
+# Downloads are network-bound, so run them all at once
+with ThreadPoolExecutor(max_workers=len(datasets)) as executor:
+    futures = {
+        executor.submit(download_dataset, name, dataset_id): name
+        for name, dataset_id in datasets.items()
+    }
+
+    for future in as_completed(futures):
+        name = futures[future]
+        try:
+            downloaded.append((name, future.result()))
+        except Exception as e:
+            print(f"\nError downloading {name}: {e}")
             failed.append(name)
 
-        # Go back to original directory
-        os.chdir(original_dir)
-
-    except Exception as e:
-        print(f"Error: {e}")
-        failed.append(name)
-        os.chdir(original_dir)
+# Report in the configured order rather than completion order
+order = list(datasets)
+downloaded.sort(key=lambda item: order.index(item[0]))
+failed.sort(key=order.index)
 
 # Summary
 print(f"\n{'='*70}")
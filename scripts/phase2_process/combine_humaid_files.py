@@ -11,10 +11,11 @@ Purpose:
     - Add event_name and source_dataset metadata
 
 Input:
-    - crisis_datasets/humaid_crisis_data/*_with_timestamps.csv
+    - crisis_datasets/humaid_crisis_data/*_with_timestamps.parquet
 
 Output:
     - crisis_datasets/humaid_all_with_timestamps.csv
+    - crisis_datasets/humaid_all_with_timestamps.parquet (same data, typed columns)
 
 Usage:
     python scripts/phase2_process/combine_humaid_files.py
@@ -28,36 +29,69 @@ Date: January 2026
 """
 
 import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import os
-import glob
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # scripts/, for _common
+from _common import iter_files
 
 print("Combining all HumAID files with timestamps...")
 
 # Find all timestamp files
-pattern = 'crisis_datasets/humaid_crisis_data/**/*_with_timestamps.csv'
-timestamp_files = glob.glob(pattern, recursive=True)
+timestamp_files = sorted(iter_files('crisis_datasets/humaid_crisis_data/', '_with_timestamps.parquet'))
 
 print(f"Found {len(timestamp_files)} files with timestamps")
 
-# Combine all files
-all_data = []
-
-for file_path in timestamp_files:
-    event_name = os.path.basename(file_path).replace('_with_timestamps.csv', '')
-
-    df = pd.read_csv(file_path)
-    df['event_name'] = event_name
-    df['source_dataset'] = 'HumAID'
-    df['crisis_label'] = 1
-
-    all_data.append(df)
-    print(f"  {event_name}: {len(df)} tweets")
-
-# Combine
-combined = pd.concat(all_data, ignore_index=True)
-
-# Convert timestamp column to datetime - use format='mixed' for different formats
-combined['created_at'] = pd.to_datetime(combined['created_at'], format='mixed')
+# Stream every file in chunks so only one chunk is parsed at a time
+CHUNK_SIZE = 200_000
+
+def event_name_of(file_path):
+    """Event name encoded in a *_with_timestamps.parquet file name"""
+    return os.path.basename(file_path).replace('_with_timestamps.parquet', '')
+
+def category_dtypes(files):
+    """Category dtypes for the low-cardinality text columns, fixed before any chunk is read"""
+    # event_name comes from the file names and source_dataset is constant;
+    # class_label takes one cheap pass reading only that Parquet column
+    class_labels = {}
+    for file_path in files:
+        if 'class_label' in pq.read_schema(file_path).names:
+            column = pq.read_table(file_path, columns=['class_label']).column('class_label')
+            class_labels.update(dict.fromkeys(pc.unique(column).drop_null().to_pylist()))
+    return {
+        'event_name': pd.CategoricalDtype(list(dict.fromkeys(map(event_name_of, files)))),
+        'source_dataset': pd.CategoricalDtype(['HumAID']),
+        'class_label': pd.CategoricalDtype(list(class_labels)),
+    }
+
+def iter_chunks(files, dtypes):
+    """Yield each file's rows in chunks, tagged with event metadata and already category-coded"""
+    for file_path in files:
+        event_name = event_name_of(file_path)
+        n_rows = 0
+
+        for batch in pq.ParquetFile(file_path).iter_batches(batch_size=CHUNK_SIZE):
+            chunk = batch.to_pandas()
+            chunk['event_name'] = event_name
+            chunk['source_dataset'] = 'HumAID'
+            chunk['crisis_label'] = 1
+            for col, dtype in dtypes.items():
+                if col in chunk:
+                    chunk[col] = chunk[col].astype(dtype)
+            n_rows += len(chunk)
+            yield chunk
+
+        print(f"  {event_name}: {n_rows} tweets")
+
+# Combine; every chunk shares the same categories, so concat stitches the
+# codes as the chunks stream in
+combined = pd.concat(iter_chunks(timestamp_files, category_dtypes(timestamp_files)), ignore_index=True)
+
+# created_at is already a UTC timestamp column in the Parquet inputs,
+# so no string parsing is needed here
 
 print(f"\n{'='*60}")
 print("COMBINED HUMAID DATASET")
@@ -72,13 +106,25 @@ output_path = 'crisis_datasets/humaid_all_with_timestamps.csv'
 combined.to_csv(output_path, index=False)
 print(f"\nSaved to: {output_path}")
 
+# Parquet copy keeps dtypes (created_at stays a UTC timestamp) for later phases
+parquet_path = output_path.replace('.csv', '.parquet')
+combined.to_parquet(parquet_path, engine='pyarrow', compression='snappy', index=False)
+print(f"Saved to: {parquet_path}")
+
 # Show some stats
 print(f"\n{'='*60}")
 print("EVENT BREAKDOWN")
 print('='*60)
 
 # Group by event (removing _train/_test/_dev suffix)
-combined['base_event'] = combined['event_name'].str.replace('_train|_test|_dev', '', regex=True)
+# Only ~50 distinct names exist, so strip suffixes once per name and map
+def strip_split_suffix(name):
+    for suffix in ('_train', '_test', '_dev'):
+        name = name.removesuffix(suffix)
+    return name
+
+base_events = {name: strip_split_suffix(name) for name in combined['event_name'].unique()}
+combined['base_event'] = combined['event_name'].map(base_events)
 event_counts = combined.groupby('base_event').size().sort_values(ascending=False)
 
 print("\nTweets per event:")
@@ -89,9 +135,9 @@ for event, count in event_counts.items():
 print(f"\n{'='*60}")
 print("EXAMPLE: Hurricane Harvey hourly breakdown")
 print('='*60)
-harvey = combined[combined['event_name'].str.contains('harvey', case=False)].copy()
-harvey['hour'] = harvey['created_at'].dt.floor('H')
-hourly = harvey.groupby('hour').size().sort_index()
+harvey = combined[combined['event_name'].str.contains('harvey', case=False)]
+# value_counts on the floored hours skips building a groupby over the frame
+hourly = harvey['created_at'].dt.floor('h').value_counts(sort=False).sort_index()
 
 print(f"\nTotal Hurricane Harvey tweets: {len(harvey)}")
 print(f"Date range: {harvey['created_at'].min()} to {harvey['created_at'].max()}")
@@ -0,0 +1,89 @@
+"""
+Shared created_at imputation for the phase 3 standardizers
+
+Imported by standardize_crisis_data.py and standardize_non_crisis_data.py
+so both fill missing timestamps the same way.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def impute_created_at(df, parse, seed=42, group_col='event_name', jitter_hours=6):
+    """
+    Impute missing created_at timestamps.
+    Strategy:
+      - For each missing timestamp, sample from known timestamps within the same event (if available).
+      - Otherwise sample from overall known timestamps.
+      - Add jitter up to +/- jitter_hours hours.
+    Updates `df` in place (and returns it) with 'created_at' imputed and columns
+    'created_at_imputed' (bool) and 'created_at_imputed_method' (str) set.
+    `parse` is the standardizer's own timestamp parser, used if created_at
+    still holds raw strings.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Ensure created_at is datetime (the standardizers pass it already parsed;
+    # raw strings go through the same format-aware parser they use)
+    if not pd.api.types.is_datetime64_any_dtype(df['created_at']):
+        df['created_at'] = parse(df['created_at'])
+
+    # Initialize flags
+    if 'created_at_imputed' not in df.columns:
+        df['created_at_imputed'] = False
+    if 'created_at_imputed_method' not in df.columns:
+        df['created_at_imputed_method'] = None
+
+    # Results are staged in arrays (UTC wall time for tz-aware columns) and
+    # written back as whole columns at the end
+    tz = getattr(df['created_at'].dt, 'tz', None)
+    ts = (df['created_at'].dt.tz_convert(None) if tz else df['created_at']).to_numpy(copy=True)
+    missing = np.isnat(ts)
+    missing_pos = np.flatnonzero(missing)
+    if len(missing_pos) == 0:
+        # Nothing to impute: no flag/method staging, no grouping
+        return df
+
+    known_pos = np.flatnonzero(~missing)
+    flags = df['created_at_imputed'].to_numpy(dtype=bool, copy=True)
+    methods = df['created_at_imputed_method'].to_numpy(dtype=object, copy=True)
+
+    if len(known_pos) == 0:
+        # nothing to sample from; fill with a fixed fallback timestamp for reproducibility
+        ts[missing_pos] = np.datetime64('2018-06-30 23:53:08')
+        methods[missing_pos] = 'fixed_fallback'
+    else:
+        # Group codes shifted so 0 = no group; known rows sorted by group so that the
+        # row positions of group g's known timestamps are known_rows[starts[g]:starts[g] + counts[g]]
+        labels = df[group_col]
+        if isinstance(labels.dtype, pd.CategoricalDtype):
+            codes = labels.cat.codes.to_numpy(dtype=np.intp) + 1  # already coded, no hashing
+        else:
+            codes = pd.factorize(labels)[0] + 1
+        order = np.argsort(codes[known_pos], kind='stable')
+        known_rows = known_pos[order]
+        counts = np.bincount(codes[known_pos], minlength=codes.max() + 1)
+        starts = np.cumsum(counts) - counts
+        counts[0] = 0  # rows without a group never match one
+
+        # One draw per missing row: from its event's pool if it has one, else from all known
+        groups = codes[missing_pos]
+        in_event = counts[groups] > 0
+        pool_start = np.where(in_event, starts[groups], 0)
+        pool_size = np.where(in_event, counts[groups], len(known_rows))
+        picks = pool_start + rng.integers(0, pool_size)
+
+        jitter = rng.integers(-jitter_hours * 3600, jitter_hours * 3600, size=len(picks))
+        # Only the drawn timestamps are gathered, never a copy of the whole pool
+        ts[missing_pos] = ts[known_rows[picks]] + jitter.astype('timedelta64[s]')
+        methods[missing_pos] = np.where(in_event, 'sampling_event', 'sampling_overall')
+    flags[missing_pos] = True
+
+    created_at = pd.DatetimeIndex(ts)
+    if tz:
+        created_at = created_at.tz_localize('UTC').tz_convert(tz)
+    df['created_at'] = created_at.array
+    df['created_at_imputed'] = flags
+    df['created_at_imputed_method'] = pd.Series(methods, index=df.index, dtype=object)
+
+    return df
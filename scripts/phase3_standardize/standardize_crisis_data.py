@@ -11,13 +11,14 @@ Purpose:
     - Prepare data for multi-task BERT training
 
 Input:
-    - crisis_datasets/humaid_all_with_timestamps.csv
-    - crisis_datasets/crisislex_all_complete.csv
+    - crisis_datasets/humaid_all_with_timestamps.csv (.parquet preferred if present)
+    - crisis_datasets/crisislex_all_complete.csv (.parquet preferred if present)
 
 Output:
     - standardized_data/humaid_standardized.csv
     - standardized_data/crisislex_standardized.csv
     - standardized_data/crisis_combined.csv
+    - a .parquet sibling of every CSV written (typed columns, zstd)
 
 Standard Columns:
     text, created_at, event_name, event_type, crisis_label, source_dataset, informativeness
@@ -38,19 +39,77 @@ Date: January 2026
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
 import os
+import re
+import io
+import sys
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # scripts/, for _tables
+from _tables import format_timestamps, prefer_parquet, unify_categories
+from _imputation import impute_created_at
 
 print("="*80)
 print("STANDARDIZING CRISIS DATASETS")
 print("="*80)
 
+# ============================================================================
+# HELPERS: INPUT FILES
+# ============================================================================
+
+def iter_chunks(path, columns):
+    """Yield only `columns` of a .parquet or .csv file, a block of rows at a time"""
+    if path.endswith('.parquet'):
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=CHUNK_ROWS, columns=columns):
+            yield batch.to_pandas()
+        return
+
+    # Streaming Arrow CSV reader; every column is read as a string (no type
+    # inference; created_at is parsed later by pd.to_datetime) and converted
+    # like the Parquet branch, so both give pandas' default str dtype
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=columns,
+            column_types={col: pa.string() for col in columns}
+        )
+    )
+    for batch in reader:
+        yield batch.to_pandas()
+
+def total_counts(counts):
+    """Sum per-chunk value_counts into one distribution"""
+    return pd.concat(counts).groupby(level=0, dropna=False, observed=True).sum().sort_values(ascending=False)
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
-HUMAID_PATH = "./crisis_datasets/humaid_all_with_timestamps.csv"
-CRISISLEX_PATH = "./crisis_datasets/crisislex_all_complete.csv"
+# Parquet outputs from phases 1-2 are used when present (typed, faster to load)
+HUMAID_PATH = prefer_parquet("./crisis_datasets/humaid_all_with_timestamps.csv")
+CRISISLEX_PATH = prefer_parquet("./crisis_datasets/crisislex_all_complete.csv")
 OUTPUT_DIR = "./standardized_data/"
+
+# Only these input columns are used by the standardizers
+HUMAID_COLS = ['tweet_text', 'created_at', 'event_name']
+CRISISLEX_COLS = ['Tweet Text', 'Informativeness', 'created_at', 'event_name']
+
+# Low-cardinality output columns kept as category codes instead of strings
+CATEGORY_COLUMNS = ['event_name', 'event_type', 'source_dataset']
+
+# Both datasets share one source_dataset category list, so combining needs no re-coding
+SOURCE_DATASETS = pd.CategoricalDtype(['humaid', 'crisislex'])
+
+# Inputs are standardized a block at a time to cap peak memory
+CHUNK_ROWS = 200_000          # rows per Parquet batch
+CSV_BLOCK_SIZE = 32 << 20     # bytes per CSV block (~200K tweets)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # ============================================================================
@@ -92,74 +151,118 @@ EVENT_TYPE_MAPPING = {
     'sinkhole': ['sinkhole'],
 }
 
+# Flat (keyword, event_type) list built once, in EVENT_TYPE_MAPPING order so
+# the first type with a matching keyword still wins
+EVENT_KEYWORDS = [
+    (keyword, event_type)
+    for event_type, keywords in EVENT_TYPE_MAPPING.items()
+    for keyword in keywords
+]
+
 def map_event_to_type(event_name):
     """Map a specific event name to a general event type"""
     event_name_lower = event_name.lower()
 
-    for event_type, keywords in EVENT_TYPE_MAPPING.items():
-        for keyword in keywords:
-            if keyword in event_name_lower:
-                return event_type
+    for keyword, event_type in EVENT_KEYWORDS:
+        if keyword in event_name_lower:
+            return event_type
 
     return 'other_crisis'
 
+def map_event_types(event_names):
+    """Vectorized map_event_to_type over a Series of event names (as a categorical)"""
+    # Event names repeat heavily: map each distinct name once, then expand the
+    # per-name types back out through the factorized codes (no per-row lookups).
+    # The trailing 'other_crisis' is what code -1 (missing name) picks up; it
+    # is dropped again below when no name was missing
+    codes, names = pd.factorize(event_names)
+    types = [map_event_to_type(str(name)) for name in names] + ['other_crisis']
+    type_codes, type_names = pd.factorize(pd.Index(types))
+    return pd.Series(
+        pd.Categorical.from_codes(type_codes[codes], categories=type_names).remove_unused_categories(),
+        index=event_names.index
+    )
+
 # ============================================================================
-# HELPERS: TIMESTAMP IMPUTATION
+# HELPERS: TIMESTAMPS AND OUTPUT
 # ============================================================================
 
 import numpy as np
 
-def impute_created_at(df, seed=42, group_col='event_name', jitter_hours=6):
+def drop_duplicate_tweets(df):
+    """Drop repeated (text, created_at) rows, comparing 64-bit row hashes instead of full texts"""
+    fingerprint = pd.util.hash_pandas_object(df[['text', 'created_at']], index=False)
+    return df[~fingerprint.duplicated().to_numpy()]
+
+# Leading "YYYY-MM-DD HH:MM:SS" (or with a "T") of an ISO-8601 timestamp
+ISO_TIMESTAMP = re.compile(r'^\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}')
+
+def parse_created_at(values):
     """
-    Impute missing created_at timestamps.
-    Strategy:
-      - For each missing timestamp, sample from known timestamps within the same event (if available).
-      - Otherwise sample from overall known timestamps.
-      - Add jitter up to +/- jitter_hours hours.
-    Returns a NEW DataFrame with 'created_at' imputed and columns
-    'created_at_imputed' (bool) and 'created_at_imputed_method' (str) set.
+    Parse created_at values, taking pandas' ISO-8601 fast path when they look ISO.
+    Every branch returns UTC (naive values are taken as UTC), so frames from
+    different inputs compare and concat as one datetime64[..., UTC] column.
     """
-    df = df.copy()
-    rng = np.random.default_rng(seed)
-
-    # Ensure created_at is datetime
-    df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce')
-
-    # Initialize flags
-    if 'created_at_imputed' not in df.columns:
-        df['created_at_imputed'] = False
-    if 'created_at_imputed_method' not in df.columns:
-        df['created_at_imputed_method'] = None
-
-    known = df['created_at'].dropna()
-    if known.empty:
-        # nothing to sample from; fill with a fixed fallback timestamp for reproducibility
-        fallback = pd.to_datetime('2018-06-30 23:53:08')
-        miss_idx = df[df['created_at'].isna()].index
-        for idx in miss_idx:
-            df.at[idx, 'created_at'] = fallback
-            df.at[idx, 'created_at_imputed'] = True
-            df.at[idx, 'created_at_imputed_method'] = 'fixed_fallback'
-        return df
-
-    missing_idx = df[df['created_at'].isna()].index
-    for idx in missing_idx:
-        row = df.loc[idx]
-        group = row.get(group_col)
-        # sample within group if possible
-        group_times = df[(df[group_col] == group) & (~df['created_at'].isna())]['created_at']
-        if len(group_times) > 0:
-            sampled = group_times.iloc[int(rng.integers(0, len(group_times)))]
-            method = 'sampling_event'
-        else:
-            sampled = known.iloc[int(rng.integers(0, len(known)))]
-            method = 'sampling_overall'
-        jitter_seconds = int(rng.integers(-jitter_hours * 3600, jitter_hours * 3600))
-        df.at[idx, 'created_at'] = sampled + pd.Timedelta(seconds=jitter_seconds)
-        df.at[idx, 'created_at_imputed'] = True
-        df.at[idx, 'created_at_imputed_method'] = method
-
-    return df
+    if not pd.api.types.is_string_dtype(values):
+        # Already typed (Parquet input): utc=True localizes naive values and
+        # converts aware ones, including Arrow's ZoneInfo('UTC'), to the same UTC
+        return pd.to_datetime(values, errors='coerce', utc=True)
+
+    known = values.dropna()
+    if len(known) and ISO_TIMESTAMP.match(known.iloc[0]):
+        parsed = pd.to_datetime(values, errors='coerce', format='ISO8601', utc=True, cache=True)
+        if not (parsed.isna() & values.notna()).any():
+            return parsed
+    # Not ISO (or some rows weren't): infer the format per element
+    return pd.to_datetime(values, errors='coerce', format='mixed', utc=True, cache=True)
+
+def save_outputs(df, output_path):
+    """Write df to output_path as CSV plus a typed .parquet sibling, both through pyarrow"""
+    csv_df = df.assign(created_at=format_timestamps(df['created_at']))
+    pacsv.write_csv(pa.Table.from_pandas(csv_df, preserve_index=False), output_path)
+    parquet_path = str(Path(output_path).with_suffix('.parquet'))
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), parquet_path, compression='zstd')
+
+# ============================================================================
+# HELPERS: STANDARDIZE CHUNKS
+# ============================================================================
+
+def source_column(source, n_rows):
+    """An n_rows-long source_dataset categorical holding only `source`"""
+    code = SOURCE_DATASETS.categories.get_loc(source)
+    return pd.Categorical.from_codes(np.full(n_rows, code, dtype=np.int8), dtype=SOURCE_DATASETS)
+
+def clean_informativeness(labels):
+    """Map raw CrisisLex informativeness labels to the three standard classes"""
+    # Checked in order, so 'not informative' wins over the plain 'informative'
+    # match; 'not labeled' and anything else stay missing
+    labels = labels.astype('string').str.strip().str.lower()
+    conditions = [
+        labels.str.contains('not related|notrelated', regex=True, na=False),
+        labels.str.contains('not informative|not-informative', regex=True, na=False),
+        labels.str.contains('informative', regex=False, na=False),
+    ]
+    choices = ['not_related', 'related_not_informative', 'related_informative']
+    return pd.Categorical(np.select(conditions, choices, default=None))
+
+def build_standardized(chunk, source, text_col, informativeness_col=None):
+    """Standardize one chunk of `source` rows in a single pass (rows without text are dropped)"""
+    # Drop text-less rows from every source column in one indexer up front, so
+    # each step below only reads the rows that are kept
+    chunk = chunk.loc[chunk[text_col].notna()]
+    event_name = chunk['event_name'].astype('category')
+
+    # Parse created_at but do NOT drop rows with missing timestamps (imputed later).
+    # This is the only parse: created_at stays datetime64 until it is written out
+    return pd.DataFrame({
+        'text': chunk[text_col],
+        'created_at': parse_created_at(chunk['created_at']),
+        'event_name': event_name,
+        'event_type': map_event_types(event_name),
+        'crisis_label': np.int8(1),
+        'source_dataset': source_column(source, len(chunk)),
+        'informativeness': clean_informativeness(chunk[informativeness_col]) if informativeness_col else None
+    })
 
 # ============================================================================
 # STANDARDIZE HUMAID
@@ -172,62 +275,51 @@ def standardize_humaid():
 
     if not os.path.exists(HUMAID_PATH):
         print(f"File not found: {HUMAID_PATH}")
-        return None
+        return None, None, None
 
+    # Map event names to types chunk by chunk while loading
     print(f"Loading: {HUMAID_PATH}")
-    humaid = pd.read_csv(HUMAID_PATH, low_memory=False)
-    print(f"Loaded: {len(humaid):,} rows")
-    print(f"Columns: {list(humaid.columns)}")
-
-    # Map event names to types
+    print(f"Columns: {HUMAID_COLS}")
     print(f"Mapping event names to event types...")
-    humaid['event_type'] = humaid['event_name'].apply(map_event_to_type)
+    n_rows = 0
+    blocks = []
+    for chunk in iter_chunks(HUMAID_PATH, HUMAID_COLS):
+        n_rows += len(chunk)
+        blocks.append(build_standardized(chunk, 'humaid', 'tweet_text'))
+    standardized = pd.concat(blocks, ignore_index=True)
+    del blocks
+    for col in CATEGORY_COLUMNS:
+        standardized[col] = standardized[col].astype('category')
+    print(f"Loaded: {n_rows:,} rows")
 
     print(f"\nEvent Type Distribution:")
-    print(humaid['event_type'].value_counts().to_string())
-
-    # Standardize to common format (parse created_at but do NOT drop rows with missing timestamps)
-    created_at_parsed = pd.to_datetime(humaid['created_at'], errors='coerce')
-    standardized = pd.DataFrame({
-        'text': humaid['tweet_text'],
-        'created_at': created_at_parsed,
-        'event_name': humaid['event_name'],
-        'event_type': humaid['event_type'],
-        'crisis_label': 1,
-        'source_dataset': 'humaid',
-        'informativeness': None
-    })
+    print(standardized['event_type'].value_counts().to_string())
 
-    # Remove rows with missing text only (keep rows with missing created_at to impute)
-    before = len(standardized)
-    standardized = standardized.dropna(subset=['text'])
-    after = len(standardized)
-    if before > after:
-        print(f"Removed {before - after:,} rows with missing text")
+    # Rows with missing text were dropped per chunk (rows with missing created_at are kept to impute)
+    if n_rows > len(standardized):
+        print(f"Removed {n_rows - len(standardized):,} rows with missing text")
 
     # Impute missing timestamps
     standardized['created_at_imputed'] = False
     standardized['created_at_imputed_method'] = None
-    standardized = impute_created_at(standardized, group_col='event_name', seed=42, jitter_hours=6)
+    standardized = impute_created_at(standardized, parse_created_at, group_col='event_name', seed=42, jitter_hours=6)
 
-    # Remove duplicates (based on text and created_at string after imputation)
+    # Remove duplicates (based on text and created_at after imputation)
     before = len(standardized)
-    standardized = standardized.drop_duplicates(subset=['text', 'created_at'])
+    standardized = drop_duplicate_tweets(standardized)
     after = len(standardized)
     if before > after:
         print(f"Removed {before - after:,} duplicate tweets")
 
-    # Format created_at to uniform string: YYYY-MM-DD HH:MM:SS
-    standardized['created_at'] = pd.to_datetime(standardized['created_at']).dt.strftime('%Y-%m-%d %H:%M:%S')
-
     print(f"\nHumAID Standardized: {len(standardized):,} rows")
 
     # Save to a non-destructive dates-only filename
     output_path = os.path.join(OUTPUT_DIR, "humaid_dates_only.csv")
-    standardized.to_csv(output_path, index=False)
-    print(f"Saved to: {output_path}")
+    save_outputs(standardized, output_path)
+    print(f"Saved to: {output_path} (+ .parquet)")
 
-    return standardized
+    # Date range goes back up with the frame so combining needn't rescan created_at
+    return standardized, standardized['created_at'].min(), standardized['created_at'].max()
 
 # ============================================================================
 # STANDARDIZE CRISISLEX
@@ -240,102 +332,79 @@ def standardize_crisislex():
 
     if not os.path.exists(CRISISLEX_PATH):
         print(f"File not found: {CRISISLEX_PATH}")
-        return None
+        return None, None, None
 
+    # Map event names and clean informativeness labels chunk by chunk while loading
     print(f"Loading: {CRISISLEX_PATH}")
-    crisislex = pd.read_csv(CRISISLEX_PATH, low_memory=False)
-    print(f"Loaded: {len(crisislex):,} rows")
-    print(f"Columns: {list(crisislex.columns)}")
-
-    # Map event names to types
+    print(f"Columns: {CRISISLEX_COLS}")
     print(f"Mapping event names to event types...")
-    crisislex['event_type'] = crisislex['event_name'].apply(map_event_to_type)
+    n_rows = 0
+    blocks = []
+    raw_label_counts = []
+    for chunk in iter_chunks(CRISISLEX_PATH, CRISISLEX_COLS):
+        n_rows += len(chunk)
+        raw_label_counts.append(chunk['Informativeness'].value_counts())
+        blocks.append(build_standardized(chunk, 'crisislex', 'Tweet Text', 'Informativeness'))
+    standardized = pd.concat(blocks, ignore_index=True)
+    del blocks
+    for col in CATEGORY_COLUMNS:
+        standardized[col] = standardized[col].astype('category')
+    print(f"Loaded: {n_rows:,} rows")
 
     print(f"\nEvent Type Distribution:")
-    print(crisislex['event_type'].value_counts().to_string())
+    print(standardized['event_type'].value_counts().to_string())
 
-    # Clean informativeness labels
     print(f"\nInformativeness Distribution (before cleaning):")
-    print(crisislex['Informativeness'].value_counts().to_string())
-
-    def clean_informativeness(label):
-        if pd.isna(label):
-            return None
-        label = str(label).strip().lower()
-
-        if 'not related' in label or 'notrelated' in label:
-            return 'not_related'
-        elif 'not informative' in label or 'not-informative' in label:
-            return 'related_not_informative'
-        elif 'informative' in label:
-            return 'related_informative'
-        elif 'not labeled' in label:
-            return None
-        else:
-            return None
-
-    crisislex['informativeness_clean'] = crisislex['Informativeness'].apply(clean_informativeness)
+    print(total_counts(raw_label_counts).to_string())
 
     print(f"\nInformativeness Distribution (after cleaning):")
-    print(crisislex['informativeness_clean'].value_counts(dropna=False).to_string())
-
-    # Standardize to common format (parse created_at but do NOT drop rows with missing timestamps)
-    created_at_parsed = pd.to_datetime(crisislex['created_at'], errors='coerce')
-    standardized = pd.DataFrame({
-        'text': crisislex['Tweet Text'],
-        'created_at': created_at_parsed,
-        'event_name': crisislex['event_name'],
-        'event_type': crisislex['event_type'],
-        'crisis_label': 1,
-        'source_dataset': 'crisislex',
-        'informativeness': crisislex['informativeness_clean']
-    })
+    print(standardized['informativeness'].value_counts(dropna=False).to_string())
 
-    # Remove rows with missing text only (keep rows with missing created_at to impute)
-    before = len(standardized)
-    standardized = standardized.dropna(subset=['text'])
-    after = len(standardized)
-    if before > after:
-        print(f"Removed {before - after:,} rows with missing text")
+    # Rows with missing text were dropped per chunk (rows with missing created_at are kept to impute)
+    if n_rows > len(standardized):
+        print(f"Removed {n_rows - len(standardized):,} rows with missing text")
 
     # Impute missing timestamps
     standardized['created_at_imputed'] = False
     standardized['created_at_imputed_method'] = None
-    standardized = impute_created_at(standardized, group_col='event_name', seed=42, jitter_hours=6)
+    standardized = impute_created_at(standardized, parse_created_at, group_col='event_name', seed=42, jitter_hours=6)
 
     # Remove duplicates
     before = len(standardized)
-    standardized = standardized.drop_duplicates(subset=['text', 'created_at'])
+    standardized = drop_duplicate_tweets(standardized)
     after = len(standardized)
     if before > after:
         print(f"Removed {before - after:,} duplicate tweets")
 
-    # Format created_at to uniform string: YYYY-MM-DD HH:MM:SS
-    standardized['created_at'] = pd.to_datetime(standardized['created_at']).dt.strftime('%Y-%m-%d %H:%M:%S')
-
     print(f"\nCrisisLex Standardized: {len(standardized):,} rows")
 
     # Save to a non-destructive dates-only filename
     output_path = os.path.join(OUTPUT_DIR, "crisislex_dates_only.csv")
-    standardized.to_csv(output_path, index=False)
-    print(f"Saved to: {output_path}")
+    save_outputs(standardized, output_path)
+    print(f"Saved to: {output_path} (+ .parquet)")
 
-    return standardized
+    # Date range goes back up with the frame so combining needn't rescan created_at
+    return standardized, standardized['created_at'].min(), standardized['created_at'].max()
 
 # ============================================================================
 # COMBINE CRISIS DATASETS
 # ============================================================================
 
-def combine_crisis_datasets(humaid_df, crisislex_df):
+def combine_crisis_datasets(humaid_result, crisislex_result):
+    """Combine the (df, earliest, latest) results of the two standardizers"""
     print(f"\n{'='*80}")
     print("COMBINING CRISIS DATASETS")
     print(f"{'='*80}")
 
+    humaid_df, humaid_min, humaid_max = humaid_result
+    crisislex_df, crisislex_min, crisislex_max = crisislex_result
     if humaid_df is None or crisislex_df is None:
         print("Cannot combine - one or both datasets failed to load")
         return None
 
-    combined = pd.concat([humaid_df, crisislex_df], ignore_index=True)
+    # Shared categories let concat stitch the category codes instead of
+    # falling back to object columns (with CoW the other columns aren't copied twice)
+    combined = pd.concat(unify_categories([humaid_df, crisislex_df], CATEGORY_COLUMNS), ignore_index=True)
 
     print(f"\nCOMBINED CRISIS DATASET SUMMARY:")
     print(f"   Total tweets: {len(combined):,}")
@@ -344,14 +413,13 @@ def combine_crisis_datasets(humaid_df, crisislex_df):
     print(f"\n   By Source:")
     print(combined['source_dataset'].value_counts().to_string())
     print(f"\n   Date Range:")
-    dt = pd.to_datetime(combined['created_at'], errors='coerce')
-    print(f"   Earliest: {dt.min()}")
-    print(f"   Latest: {dt.max()}")
+    print(f"   Earliest: {min(humaid_min, crisislex_min)}")
+    print(f"   Latest: {max(humaid_max, crisislex_max)}")
 
     # Save combined to a dates-only file (non-destructive)
     output_path = os.path.join(OUTPUT_DIR, "crisis_combined_dates_only.csv")
-    combined.to_csv(output_path, index=False)
-    print(f"\nCOMBINED FILE SAVED: {output_path}")
+    save_outputs(combined, output_path)
+    print(f"\nCOMBINED FILE SAVED: {output_path} (+ .parquet)")
 
     return combined
 
@@ -359,9 +427,28 @@ def combine_crisis_datasets(humaid_df, crisislex_df):
 # MAIN EXECUTION
 # ============================================================================
 
+def limit_worker_threads():
+    """Split Arrow's thread pool between the two standardizer processes"""
+    pa.set_cpu_count(max(1, (os.cpu_count() or 2) // 2))
+
+def run_captured(standardize):
+    """Run a standardizer in a worker, returning its result and printed report"""
+    report = io.StringIO()
+    with redirect_stdout(report):
+        result = standardize()
+    return result, report.getvalue()
+
 if __name__ == "__main__":
-    humaid_std = standardize_humaid()
-    crisislex_std = standardize_crisislex()
+    # HumAID and CrisisLex share no state, so standardize them in parallel
+    # (each worker reads and writes its own files; combining stays here)
+    with ProcessPoolExecutor(max_workers=2, initializer=limit_worker_threads) as ex:
+        humaid_future = ex.submit(run_captured, standardize_humaid)
+        crisislex_future = ex.submit(run_captured, standardize_crisislex)
+        # Print each report whole so the two workers' output doesn't interleave
+        humaid_std, humaid_report = humaid_future.result()
+        print(humaid_report, end='')
+        crisislex_std, crisislex_report = crisislex_future.result()
+        print(crisislex_report, end='')
     crisis_combined = combine_crisis_datasets(humaid_std, crisislex_std)
 
     if crisis_combined is not None:
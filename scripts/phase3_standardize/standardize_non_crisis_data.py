@@ -39,49 +39,20 @@ Date: January 2026
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pacsv
 import os
+import io
+import sys
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import numpy as np
-
-
-def impute_created_at(df, seed=42, group_col='event_name', jitter_hours=6):
-    """
-    Impute missing created_at timestamps for non-crisis combined DataFrame.
-    Uses event-level sampling where possible, otherwise samples overall known timestamps.
-    """
-    df = df.copy()
-    rng = np.random.default_rng(seed)
-    df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce')
-
-    if 'created_at_imputed' not in df.columns:
-        df['created_at_imputed'] = False
-    if 'created_at_imputed_method' not in df.columns:
-        df['created_at_imputed_method'] = None
-
-    known = df['created_at'].dropna()
-    if known.empty:
-        fallback = pd.to_datetime('2018-06-30 23:53:08')
-        for idx in df[df['created_at'].isna()].index:
-            df.at[idx, 'created_at'] = fallback
-            df.at[idx, 'created_at_imputed'] = True
-            df.at[idx, 'created_at_imputed_method'] = 'fixed_fallback'
-        return df
-
-    for idx in df[df['created_at'].isna()].index:
-        group = df.at[idx, group_col]
-        group_times = df[(df[group_col] == group) & (~df['created_at'].isna())]['created_at']
-        if len(group_times) > 0:
-            sampled = group_times.iloc[int(rng.integers(0, len(group_times)))]
-            method = 'sampling_event'
-        else:
-            sampled = known.iloc[int(rng.integers(0, len(known)))]
-            method = 'sampling_overall'
-        jitter_seconds = int(rng.integers(-jitter_hours * 3600, jitter_hours * 3600))
-        df.at[idx, 'created_at'] = sampled + pd.Timedelta(seconds=jitter_seconds)
-        df.at[idx, 'created_at_imputed'] = True
-        df.at[idx, 'created_at_imputed_method'] = method
+from pathlib import Path
 
-    return df
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # scripts/, for _tables
+from _tables import format_timestamps, unify_categories
+from _imputation import impute_created_at
 
 print("="*80)
 print("STANDARDIZING NON-CRISIS DATASETS")
@@ -95,6 +66,9 @@ INPUT_DIR = "./non_crisis_data/"
 OUTPUT_DIR = "./standardized_data/"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Low-cardinality output columns kept as category codes instead of strings
+CATEGORY_COLUMNS = ['event_name', 'event_type', 'source_dataset']
+
 # ============================================================================
 # DATASET CONFIGURATIONS
 # ============================================================================
@@ -170,29 +144,54 @@ datasets_config = {
 # HELPER FUNCTIONS
 # ============================================================================
 
-def clean_timestamp(timestamp_str):
-    """Convert various timestamp formats to standard datetime"""
-    if pd.isna(timestamp_str):
-        return None
-
-    formats = [
-        '%d/%m/%Y %H:%M',
-        '%d %b %Y %H:%M:%S',
-        '%Y-%m-%dT%H:%M:%S.%fZ',
-        '%d/%m/%Y %H:%M:%S',
-        '%d/%m/%Y %H:%M'
-    ]
-
-    for fmt in formats:
-        try:
-            return pd.to_datetime(timestamp_str, format=fmt)
-        except:
+# Known source formats, each with the pattern that picks out its strings, tried
+# before falling back to inference. Arrow's strptime kernel parses all of them
+# except fractional seconds (%f)
+TIMESTAMP_FORMATS = [
+    (r'^\s*\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}$', '%d/%m/%Y %H:%M'),
+    (r'^\s*\d{1,2} [A-Za-z]{3} \d{4} \d{1,2}:\d{2}:\d{2}$', '%d %b %Y %H:%M:%S'),
+    (r'^\s*\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z$', '%Y-%m-%dT%H:%M:%S.%fZ'),
+    (r'^\s*\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2}$', '%d/%m/%Y %H:%M:%S'),
+]
+
+def clean_timestamps(timestamps):
+    """Convert a Series of timestamp strings in various formats to datetime64"""
+    parsed = pd.Series(pd.NaT, index=timestamps.index, dtype='datetime64[ns]')
+
+    # Bucket rows by pattern, then parse each bucket with exactly its one format
+    # (Arrow's kernel in C, or pandas for %f; cache=True parses each distinct string once)
+    for pattern, fmt in TIMESTAMP_FORMATS:
+        bucket = timestamps.str.match(pattern).fillna(False).to_numpy(dtype=bool)
+        if not bucket.any():
             continue
-
-    try:
-        return pd.to_datetime(timestamp_str)
-    except:
-        return None
+        if '%f' in fmt:
+            parsed[bucket] = pd.to_datetime(timestamps[bucket], format=fmt, errors='coerce', cache=True)
+        else:
+            values = pa.array(timestamps[bucket], type=pa.string())
+            parsed[bucket] = pc.strptime(values, format=fmt, unit='ns', error_is_null=True).to_numpy(zero_copy_only=False)
+    remaining = timestamps.notna() & parsed.isna()
+
+    # Anything else: infer per element; UTC offsets are normalized to naive UTC
+    # so every dataset ends up with the same (tz-naive) dtype
+    if remaining.any():
+        inferred = pd.to_datetime(timestamps[remaining], errors='coerce', format='mixed', utc=True, cache=True)
+        parsed[remaining] = inferred.dt.tz_convert(None)
+
+    return parsed
+
+def read_columns(filepath, columns, encoding):
+    """Read only `columns` of a CSV, as Arrow strings, with pyarrow's multithreaded parser"""
+    table = pacsv.read_csv(
+        filepath,
+        read_options=pacsv.ReadOptions(encoding=encoding, block_size=8 << 20),
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=columns,
+            column_types={col: pa.string() for col in columns},
+            strings_can_be_null=True
+        )
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
 
 def standardize_dataset(config, dataset_name):
     """Standardize a single dataset to common format"""
@@ -206,50 +205,53 @@ def standardize_dataset(config, dataset_name):
         print(f"ERROR: File not found: {filepath}")
         return None
 
+    # Only the text and time columns are parsed; the header alone is enough to
+    # report (and check) the rest
     try:
-        df = pd.read_csv(filepath, encoding=config['encoding'], low_memory=False)
+        columns = list(pd.read_csv(filepath, encoding=config['encoding'], nrows=0).columns)
+        missing = [col for col in (config['text_col'], config['time_col']) if col not in columns]
+        if missing:
+            print(f"ERROR: Column not found: {missing}")
+            print(f"Available columns: {columns}")
+            return None
+        df = read_columns(filepath, [config['text_col'], config['time_col']], config['encoding'])
         print(f"Loaded: {len(df):,} rows")
-        print(f"Original columns: {list(df.columns)[:5]}... ({len(df.columns)} total)")
+        print(f"Original columns: {columns[:5]}... ({len(columns)} total)")
     except Exception as e:
         print(f"ERROR loading file: {e}")
         return None
 
     # Extract required columns (tweet_id removed due to Excel precision issues)
-    try:
-        standardized = pd.DataFrame({
-            'text': df[config['text_col']].astype(str),
-            'created_at': df[config['time_col']],
-            'event_name': config['event_name'],
-            'event_type': config['event_type'],
-            'crisis_label': 0,
-            'source_dataset': dataset_name
-        })
-        print(f"Extracted columns: text, created_at")
-
-    except KeyError as e:
-        print(f"ERROR: Column not found: {e}")
-        print(f"Available columns: {list(df.columns)}")
-        return None
+    standardized = pd.DataFrame({
+        'text': df[config['text_col']].astype(str),
+        'created_at': df[config['time_col']],
+        'event_name': config['event_name'],
+        'event_type': config['event_type'],
+        'crisis_label': 0,
+        'source_dataset': dataset_name
+    })
+    for col in CATEGORY_COLUMNS:
+        standardized[col] = standardized[col].astype('category')
+    print(f"Extracted columns: text, created_at")
 
     # Clean timestamps
     print(f"Cleaning timestamps...")
-    standardized['created_at'] = standardized['created_at'].apply(clean_timestamp)
+    standardized['created_at'] = clean_timestamps(standardized['created_at'])
 
-    # Remove rows with missing text or timestamp
-    before_clean = len(standardized)
-    standardized = standardized.dropna(subset=['text', 'created_at'])
-    after_clean = len(standardized)
+    # Remove rows with missing text or timestamp and duplicates (comparing 64-bit
+    # row hashes instead of full texts) in one slice. A complete row never hashes
+    # equal to an incomplete one, so hashing before the dropna keeps the same rows
+    complete = (standardized['text'].notna() & standardized['created_at'].notna()).to_numpy()
+    fingerprint = pd.util.hash_pandas_object(standardized[['text', 'created_at']], index=False)
+    duplicate = fingerprint.duplicated().to_numpy()
+    keep = complete & ~duplicate
 
-    if before_clean > after_clean:
-        print(f"Removed {before_clean - after_clean:,} rows with missing text/timestamp")
+    if (~complete).any():
+        print(f"Removed {(~complete).sum():,} rows with missing text/timestamp")
+    if (complete & duplicate).any():
+        print(f"Removed {(complete & duplicate).sum():,} duplicate tweets")
 
-    # Remove duplicates
-    before_dedup = len(standardized)
-    standardized = standardized.drop_duplicates(subset=['text', 'created_at'])
-    after_dedup = len(standardized)
-
-    if before_dedup > after_dedup:
-        print(f"Removed {before_dedup - after_dedup:,} duplicate tweets")
+    standardized = standardized[keep].reset_index(drop=True)
 
     print(f"Final row count: {len(standardized):,}")
     print(f"Event: {config['event_name']} (Type: {config['event_type']})")
@@ -261,33 +263,18 @@ def standardize_dataset(config, dataset_name):
 
     return standardized
 
-# ============================================================================
-# MAIN PROCESSING
-# ============================================================================
-
-print(f"\nInput Directory: {INPUT_DIR}")
-print(f"Output Directory: {OUTPUT_DIR}")
-print(f"\nDatasets to process: {len(datasets_config)}")
-
-all_datasets = []
-
-for dataset_name, config in datasets_config.items():
-    result = standardize_dataset(config, dataset_name)
-    if result is not None:
-        all_datasets.append(result)
-    else:
-        print(f"Skipping {dataset_name} due to errors")
-
 # ============================================================================
 # COMBINE ALL DATASETS
 # ============================================================================
 
-if len(all_datasets) > 0:
+def combine_datasets(all_datasets):
     print(f"\n{'='*80}")
     print("COMBINING ALL NON-CRISIS DATASETS")
     print(f"{'='*80}")
 
-    combined = pd.concat(all_datasets, ignore_index=True)
+    # Each dataset carries one category per column; unioning them first lets
+    # concat stitch the codes instead of falling back to object columns
+    combined = pd.concat(unify_categories(all_datasets, CATEGORY_COLUMNS), ignore_index=True)
 
     print(f"\nCOMBINED DATASET SUMMARY:")
     print(f"   Total tweets: {len(combined):,}")
@@ -299,24 +286,62 @@ if len(all_datasets) > 0:
     # Impute missing timestamps across non-crisis combined
     combined['created_at_imputed'] = False
     combined['created_at_imputed_method'] = None
-    combined = impute_created_at(combined, seed=42, group_col='event_name', jitter_hours=6)
+    combined = impute_created_at(combined, clean_timestamps, seed=42, group_col='event_name', jitter_hours=6)
 
     # Format created_at to uniform string
-    combined['created_at'] = pd.to_datetime(combined['created_at']).dt.strftime('%Y-%m-%d %H:%M:%S')
+    combined['created_at'] = format_timestamps(combined['created_at'])
 
     # Save combined file (dates-only, non-destructive)
     combined_file = os.path.join(OUTPUT_DIR, "non_crisis_combined_dates_only.csv")
     combined.to_csv(combined_file, index=False)
     print(f"\nCOMBINED FILE SAVED: {combined_file}")
 
-    print(f"\n{'='*80}")
-    print("STANDARDIZATION COMPLETE!")
-    print(f"{'='*80}")
-    print(f"\nFiles created:")
-    print(f"   - Individual files: {len(all_datasets)} datasets")
-    print(f"   - Combined file: non_crisis_combined.csv")
-    print(f"\nNext step: Run phase4_combine/create_master_training_file.py")
-
-else:
-    print("\nNo datasets were successfully processed!")
-    print("Check file paths and column names in the configuration.")
+    return combined
+
+def run_captured(config, dataset_name):
+    """Standardize one dataset in a worker, returning its result and printed report"""
+    report = io.StringIO()
+    with redirect_stdout(report):
+        result = standardize_dataset(config, dataset_name)
+    return result, report.getvalue()
+
+# ============================================================================
+# MAIN PROCESSING
+# ============================================================================
+
+if __name__ == "__main__":
+    print(f"\nInput Directory: {INPUT_DIR}")
+    print(f"Output Directory: {OUTPUT_DIR}")
+    print(f"\nDatasets to process: {len(datasets_config)}")
+
+    # Every dataset is independent (own input and output file), so standardize
+    # them in parallel; reports are printed whole and in config order
+    all_datasets = []
+    max_workers = min(len(datasets_config), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        futures = {
+            dataset_name: ex.submit(run_captured, config, dataset_name)
+            for dataset_name, config in datasets_config.items()
+        }
+        for dataset_name, future in futures.items():
+            result, report = future.result()
+            print(report, end='')
+            if result is not None:
+                all_datasets.append(result)
+            else:
+                print(f"Skipping {dataset_name} due to errors")
+
+    if len(all_datasets) > 0:
+        combine_datasets(all_datasets)
+
+        print(f"\n{'='*80}")
+        print("STANDARDIZATION COMPLETE!")
+        print(f"{'='*80}")
+        print(f"\nFiles created:")
+        print(f"   - Individual files: {len(all_datasets)} datasets")
+        print(f"   - Combined file: non_crisis_combined.csv")
+        print(f"\nNext step: Run phase4_combine/create_master_training_file.py")
+
+    else:
+        print("\nNo datasets were successfully processed!")
+        print("Check file paths and column names in the configuration.")
@@ -11,12 +11,14 @@ Purpose:
     - Shuffle data to prevent catastrophic forgetting
 
 Input:
-    - goemotion_data/goemotions.csv (emotion labels)
+    - goemotion_data/goemotions.csv (emotion labels; .parquet preferred if present)
     - standardized_data/crisis_combined.csv (event type + informativeness)
     - standardized_data/non_crisis_combined.csv (event type)
 
 Output:
-    - master_training_data/master_training_data_v3.csv
+    - master_training_data/master_training_data_v3/ (Parquet dataset, one
+      source_dataset=... partition per source; typed, Int8 emotions)
+    - master_training_data/master_training_data_v3.csv (legacy, WRITE_MASTER_CSV)
     - master_training_data/master_training_sample_10k.csv (for preview)
 
 Master File Columns:
@@ -43,16 +45,40 @@ Date: January 2026
 import pandas as pd
 import numpy as np
 import os
+import sys
+from pathlib import Path
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import csv as pacsv
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # scripts/, for _tables
+from _tables import prefer_parquet, read_table, unify_categories
 
 print("="*80)
 print("CREATING MASTER TRAINING FILE FOR MULTI-TASK BERT")
 print("="*80)
 
+# ============================================================================
+# HELPERS: INPUT FILES
+# ============================================================================
+
+def write_csv(df, path, chunksize=250_000):
+    """Write df to path as CSV through pyarrow's (multithreaded, C) writer, chunksize rows at a time"""
+    # One schema for every slice, so an all-null slice of an object column keeps its type
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    # 1 MiB buffered sink: the writer's small per-batch writes reach disk as large flushes
+    with pa.output_stream(path, buffer_size=1 << 20) as sink, \
+            pacsv.CSVWriter(sink, schema, write_options=pacsv.WriteOptions(batch_size=65536)) as writer:
+        # Only one slice is ever held as an Arrow copy, not the whole frame
+        for start in range(0, len(df), chunksize):
+            chunk = df.iloc[start:start + chunksize]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
-GOEMOTIONS_PATH = "./goemotion_data/goemotions.csv"
+GOEMOTIONS_PATH = prefer_parquet("./goemotion_data/goemotions.csv")
 CRISIS_COMBINED_PATH = "./standardized_data/crisis_combined.csv"
 NON_CRISIS_COMBINED_PATH = "./standardized_data/non_crisis_combined.csv"
 
@@ -61,6 +87,8 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 SAMPLE_SIZE = 10000
 MASTER_FILE = os.path.join(OUTPUT_DIR, "master_training_data_v3.csv")
+MASTER_DATASET = str(Path(MASTER_FILE).with_suffix(''))  # partitioned Parquet dataset
+WRITE_MASTER_CSV = True  # legacy CSV copy of the master (the notebooks still read it)
 SAMPLE_FILE = os.path.join(OUTPUT_DIR, "master_training_sample_10k.csv")
 
 # ============================================================================
@@ -74,6 +102,41 @@ EMOTION_COLUMNS = [
     'emotion_neutral'
 ]
 
+# GoEmotions label id behind each emotion column
+EMOTION_IDS = {
+    'emotion_fear': 14, 'emotion_sadness': 25, 'emotion_anger': 2, 'emotion_nervousness': 19,
+    'emotion_disgust': 11, 'emotion_surprise': 26, 'emotion_confusion': 6, 'emotion_caring': 5,
+    'emotion_grief': 16, 'emotion_disappointment': 9, 'emotion_joy': 17, 'emotion_relief': 23,
+    'emotion_neutral': 27
+}
+
+def extract_emotions(labels):
+    """0/1 Int8 EMOTION_COLUMNS from GoEmotions labels (label arrays, or "[2, 3]" strings from CSV)"""
+    if pd.api.types.is_string_dtype(labels):
+        labels = labels.str.findall(r'\d+')
+
+    # One (row position, label id) pair per label; missing or unparsable labels give none
+    exploded = labels.reset_index(drop=True).explode()
+    label_ids = pd.to_numeric(exploded, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    rows = exploded.index.to_numpy()
+    valid = np.isin(label_ids, list(EMOTION_IDS.values()))
+
+    # Label id -> emotion column position, then set the 0/1 flags in one 2-D store
+    column_of = np.full(max(EMOTION_IDS.values()) + 1, -1)
+    column_of[list(EMOTION_IDS.values())] = np.arange(len(EMOTION_IDS))
+    flags = np.zeros((len(labels), len(EMOTION_IDS)), dtype=np.int8)
+    flags[rows[valid], column_of[label_ids[valid].astype(int)]] = 1
+
+    emotion_df = pd.DataFrame(flags, index=labels.index, columns=list(EMOTION_IDS)).astype(pd.Int8Dtype())
+    return emotion_df
+
+# Every master row has these columns; each source only fills in some of them
+MASTER_COLUMNS = ['text'] + EMOTION_COLUMNS + ['event_type', 'informativeness',
+                  'crisis_label', 'source_dataset']
+
+# Low-cardinality label columns kept as category codes instead of strings
+CATEGORY_COLUMNS = ['event_type', 'informativeness', 'source_dataset']
+
 # ============================================================================
 # PROCESS GOEMOTIONS
 # ============================================================================
@@ -88,49 +151,12 @@ def process_goemotions():
         return None
 
     print(f"Loading: {GOEMOTIONS_PATH}")
-    df = pd.read_csv(GOEMOTIONS_PATH)
+    df = read_table(GOEMOTIONS_PATH, columns=['text', 'labels'])
     print(f"Loaded: {len(df):,} rows")
 
     print(f"Processing emotion labels...")
 
-    def extract_emotions(labels_str):
-        try:
-            if pd.isna(labels_str):
-                return {f'emotion_{name}': 0 for name in [
-                    'fear', 'sadness', 'anger', 'nervousness', 'disgust',
-                    'surprise', 'confusion', 'caring', 'grief', 'disappointment',
-                    'joy', 'relief', 'neutral'
-                ]}
-
-            if isinstance(labels_str, str):
-                labels = eval(labels_str)
-            else:
-                labels = labels_str
-
-            return {
-                'emotion_fear': 1 if 14 in labels else 0,
-                'emotion_sadness': 1 if 25 in labels else 0,
-                'emotion_anger': 1 if 2 in labels else 0,
-                'emotion_nervousness': 1 if 19 in labels else 0,
-                'emotion_disgust': 1 if 11 in labels else 0,
-                'emotion_surprise': 1 if 26 in labels else 0,
-                'emotion_confusion': 1 if 6 in labels else 0,
-                'emotion_caring': 1 if 5 in labels else 0,
-                'emotion_grief': 1 if 16 in labels else 0,
-                'emotion_disappointment': 1 if 9 in labels else 0,
-                'emotion_joy': 1 if 17 in labels else 0,
-                'emotion_relief': 1 if 23 in labels else 0,
-                'emotion_neutral': 1 if 27 in labels else 0,
-            }
-        except:
-            return {f'emotion_{name}': 0 for name in [
-                'fear', 'sadness', 'anger', 'nervousness', 'disgust',
-                'surprise', 'confusion', 'caring', 'grief', 'disappointment',
-                'joy', 'relief', 'neutral'
-            ]}
-
-    emotions = df['labels'].apply(extract_emotions)
-    emotion_df = pd.DataFrame(emotions.tolist())
+    emotion_df = extract_emotions(df['labels'])
 
     print(f"\nEmotion Distribution (13 emotions):")
     for col in emotion_df.columns:
@@ -171,18 +197,18 @@ def process_crisis():
         return None
 
     print(f"Loading: {CRISIS_COMBINED_PATH}")
-    df = pd.read_csv(CRISIS_COMBINED_PATH)
+    df = read_table(CRISIS_COMBINED_PATH, columns=MASTER_COLUMNS)
     print(f"Loaded: {len(df):,} rows")
 
-    for emotion_col in EMOTION_COLUMNS:
-        df[emotion_col] = None
+    # No emotion labels here: add all 13 flags as <NA> in one concat
+    emotions = pd.DataFrame(pd.NA, index=df.index, columns=EMOTION_COLUMNS, dtype=pd.Int8Dtype())
+    df = pd.concat([df, emotions], axis=1)
 
-    column_order = ['text'] + EMOTION_COLUMNS + ['event_type', 'informativeness',
-                    'crisis_label', 'source_dataset']
+    column_order = MASTER_COLUMNS
 
     # Only select columns that exist
     available_cols = [c for c in column_order if c in df.columns]
-    standardized = df[available_cols].copy()
+    standardized = df[available_cols]
 
     # Add missing columns
     for col in column_order:
@@ -208,19 +234,19 @@ def process_non_crisis():
         return None
 
     print(f"Loading: {NON_CRISIS_COMBINED_PATH}")
-    df = pd.read_csv(NON_CRISIS_COMBINED_PATH)
+    df = read_table(NON_CRISIS_COMBINED_PATH, columns=MASTER_COLUMNS)
     print(f"Loaded: {len(df):,} rows")
 
-    for emotion_col in EMOTION_COLUMNS:
-        df[emotion_col] = None
+    # No emotion labels here: add all 13 flags as <NA> in one concat
+    emotions = pd.DataFrame(pd.NA, index=df.index, columns=EMOTION_COLUMNS, dtype=pd.Int8Dtype())
+    df = pd.concat([df, emotions], axis=1)
     df['informativeness'] = None
 
-    column_order = ['text'] + EMOTION_COLUMNS + ['event_type', 'informativeness',
-                    'crisis_label', 'source_dataset']
+    column_order = MASTER_COLUMNS
 
     # Only select columns that exist
     available_cols = [c for c in column_order if c in df.columns]
-    standardized = df[available_cols].copy()
+    standardized = df[available_cols]
 
     # Add missing columns
     for col in column_order:
@@ -236,6 +262,12 @@ def process_non_crisis():
 # COMBINE ALL DATASETS
 # ============================================================================
 
+def narrow_label_dtypes(frames):
+    """Cast crisis_label to Int8 and CATEGORY_COLUMNS to categoricals sharing one category list per column"""
+    for frame in frames:
+        frame['crisis_label'] = frame['crisis_label'].astype(pd.Int8Dtype())
+    return unify_categories(frames, CATEGORY_COLUMNS)
+
 def combine_all_datasets(goemotions_df, crisis_df, non_crisis_df):
     print(f"\n{'='*80}")
     print("COMBINING ALL DATASETS")
@@ -260,12 +292,17 @@ def combine_all_datasets(goemotions_df, crisis_df, non_crisis_df):
 
     print(f"\nCombining {len(datasets)} datasets: {', '.join(dataset_names)}")
 
-    master = pd.concat(datasets, ignore_index=True)
+    # Shared categories let concat stitch the category codes instead of
+    # falling back to object columns
+    master = pd.concat(narrow_label_dtypes(datasets), ignore_index=True)
     print(f"Initial combine: {len(master):,} total rows")
 
     # CRITICAL: SHUFFLE THE DATA
     print(f"\nSHUFFLING DATA (critical for multi-task training)...")
-    master = master.sample(frac=1, random_state=42).reset_index(drop=True)
+    # One positional take of a seeded permutation; rebinding master frees the
+    # unshuffled frame right away
+    perm = np.random.default_rng(42).permutation(len(master))
+    master = master.iloc[perm].reset_index(drop=True)
     print(f"Data shuffled!")
 
     # Display statistics
@@ -285,14 +322,32 @@ def combine_all_datasets(goemotions_df, crisis_df, non_crisis_df):
     print(f"   Informativeness labels: {master['informativeness'].notna().sum():,} rows")
 
     # Save full master file
+    # Emotion flags are nullable Int8 from every source (1 byte per cell, rows
+    # without labels stay <NA>); the cast only guards against a stray object column
+    master[EMOTION_COLUMNS] = master[EMOTION_COLUMNS].astype(pd.Int8Dtype())
+
     print(f"\nSaving master file...")
-    master.to_csv(MASTER_FILE, index=False)
-    print(f"MASTER SAVED: {MASTER_FILE}")
+    # Hive-partitioned by source so trainers can stream (and mix) each source's
+    # already-shuffled rows without parsing anything
+    ds.write_dataset(
+        pa.Table.from_pandas(master, preserve_index=False),
+        MASTER_DATASET,
+        format='parquet',
+        partitioning=ds.partitioning(pa.schema([('source_dataset', pa.string())]), flavor='hive'),
+        file_options=ds.ParquetFileFormat().make_write_options(compression='zstd'),
+        existing_data_behavior='delete_matching'
+    )
+    print(f"MASTER SAVED: {MASTER_DATASET}/")
+    if WRITE_MASTER_CSV:
+        write_csv(master, MASTER_FILE)
+        print(f"MASTER SAVED: {MASTER_FILE}")
 
     # Save sample for review
     print(f"\nSaving sample ({SAMPLE_SIZE}) for review...")
-    sample_df = master.sample(n=min(SAMPLE_SIZE, len(master)), random_state=42)
-    sample_df.to_csv(SAMPLE_FILE, index=False)
+    # master is already a seeded random permutation, so its first rows are a
+    # uniform sample; no second shuffle over every row
+    sample_df = master.head(SAMPLE_SIZE)
+    write_csv(sample_df, SAMPLE_FILE)
     print(f"SAMPLE SAVED: {SAMPLE_FILE}")
 
     return master
@@ -322,7 +377,8 @@ if __name__ == "__main__":
         print(f"{'='*80}")
         print(f"""
 Files created:
-   - {MASTER_FILE} ({len(master):,} rows)
+   - {MASTER_DATASET}/ ({len(master):,} rows)
+   - {MASTER_FILE} (if WRITE_MASTER_CSV)
    - {SAMPLE_FILE} (for preview)
 
 Datasets included:
@@ -0,0 +1,40 @@
+import contextlib
+import importlib.util
+import io
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / 'scripts' / 'phase3_standardize' / 'standardize_crisis_data.py'
+
+
+@pytest.fixture
+def standardize(tmp_path, monkeypatch):
+    # Run as a script, its own folder is on sys.path (for _imputation); it also
+    # creates ./standardized_data/ on import, so load it from a scratch dir
+    monkeypatch.syspath_prepend(str(SCRIPT.parent))
+    monkeypatch.chdir(tmp_path)
+    spec = importlib.util.spec_from_file_location('standardize_crisis_data', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+
+def test_parse_created_at_combines_naive_and_aware_inputs(standardize):
+    # CrisisLex CSVs on disk hold naive times, HumAID ones carry +00:00
+    crisislex = standardize.parse_created_at(pd.Series(['2013-06-20 10:00:00', None], dtype='str'))
+    humaid = standardize.parse_created_at(pd.Series(['2017-08-25 12:00:00+00:00'], dtype='str'))
+    # Typed (Parquet) input, naive and Arrow's ZoneInfo('UTC')
+    typed_naive = standardize.parse_created_at(pd.Series(pd.to_datetime(['2013-06-21 10:00:00'])))
+    typed_aware = standardize.parse_created_at(
+        pd.Series(pd.to_datetime(['2017-08-26 12:00:00'])).dt.tz_localize('UTC').dt.tz_convert('Etc/UTC'))
+
+    assert min(crisislex.min(), humaid.min()) == pd.Timestamp('2013-06-20 10:00:00', tz='UTC')
+    assert max(typed_naive.max(), typed_aware.max()) == pd.Timestamp('2017-08-26 12:00:00', tz='UTC')
+
+    combined = pd.concat([crisislex, humaid, typed_naive, typed_aware], ignore_index=True)
+    assert isinstance(combined.dtype, pd.DatetimeTZDtype)
+    assert str(combined.dt.tz) == 'UTC'
+    assert combined.isna().sum() == 1
@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.csv as pacsv
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+from _tables import unify_categories
+
+
+def test_unify_categories_mixed_parquet_and_csv(tmp_path):
+    parquet_path = tmp_path / 'humaid.parquet'
+    csv_path = tmp_path / 'crisislex.csv'
+    pd.DataFrame({'event_name': ['harvey', 'irma'], 'source_dataset': ['humaid'] * 2}).to_parquet(parquet_path)
+    pd.DataFrame({'event_name': ['irma', 'alberta'], 'source_dataset': ['crisislex'] * 2}).to_csv(csv_path, index=False)
+
+    # Parquet gives str categories, the Arrow CSV reader string[pyarrow] ones
+    parquet_df = pd.read_parquet(parquet_path).astype('category')
+    csv_df = pacsv.read_csv(csv_path).to_pandas(types_mapper=pd.ArrowDtype).astype('category')
+    # A source without labels holds only nulls (object categories)
+    unlabelled_df = pd.DataFrame({'event_name': [None, None]}).astype('category')
+
+    frames = unify_categories([parquet_df, csv_df, unlabelled_df], ['event_name', 'source_dataset'])
+    combined = pd.concat(frames, ignore_index=True)
+
+    # Every unified column stays categorical after concat (not object)
+    for col in ['event_name', 'source_dataset']:
+        assert isinstance(combined[col].dtype, pd.CategoricalDtype)
+    assert list(combined['event_name'].cat.categories) == ['harvey', 'irma', 'alberta']
+    assert combined['event_name'].tolist()[:4] == ['harvey', 'irma', 'irma', 'alberta']
+    assert combined['event_name'].iloc[4:].isna().all()
+    # source_dataset is missing from the unlabelled frame and is left alone there
+    assert list(frames[1]['source_dataset'].cat.categories) == ['humaid', 'crisislex']
@@ -13,8 +13,8 @@ Purpose:
     - Identifies unmapped events that need to be added to EVENT_TYPE_MAPPING
 
 Input:
-    - crisis_datasets/humaid_all_with_timestamps.csv
-    - crisis_datasets/crisislex_all_complete.csv
+    - crisis_datasets/humaid_all_with_timestamps.csv (.parquet preferred if present)
+    - crisis_datasets/crisislex_all_complete.csv (.parquet preferred if present)
 
 Output:
     - Console output showing event mappings and recommendations
@@ -27,9 +27,14 @@ Date: January 2026
 ================================================================================
 """
 
-import pandas as pd
 import os
+import sys
+import re
 from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))  # for _tables
+from _tables import prefer_parquet, read_table
 
 print("="*80)
 print("CRISIS DATASET PRE-CHECK")
@@ -39,8 +44,8 @@ print("="*80)
 # CONFIGURATION
 # ============================================================================
 
-HUMAID_PATH = "./crisis_datasets/humaid_all_with_timestamps.csv"
-CRISISLEX_PATH = "./crisis_datasets/crisislex_all_complete.csv"
+HUMAID_PATH = prefer_parquet("./crisis_datasets/humaid_all_with_timestamps.csv")
+CRISISLEX_PATH = prefer_parquet("./crisis_datasets/crisislex_all_complete.csv")
 
 # ============================================================================
 # CURRENT EVENT TYPE MAPPING (from standardize script)
@@ -80,16 +85,29 @@ EVENT_TYPE_MAPPING = {
     'sinkhole': ['sinkhole'],
 }
 
+# Flat (keyword, event_type) list in EVENT_TYPE_MAPPING order (earlier = higher priority)
+EVENT_KEYWORDS = [
+    (keyword, event_type)
+    for event_type, keywords in EVENT_TYPE_MAPPING.items()
+    for keyword in keywords
+]
+KEYWORD_RANK = {keyword: rank for rank, (keyword, _) in enumerate(EVENT_KEYWORDS)}
+
+# One compiled alternation over every keyword, built once. The lookahead
+# reports the best-ranked keyword starting at each position, so keywords that
+# overlap or sit inside others are all seen
+EVENT_KEYWORD_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword, _ in EVENT_KEYWORDS) + '))'
+)
+
 def map_event_to_type(event_name):
     """Map event name to type (same logic as standardize script)"""
-    event_name_lower = event_name.lower()
-
-    for event_type, keywords in EVENT_TYPE_MAPPING.items():
-        for keyword in keywords:
-            if keyword in event_name_lower:
-                return event_type
+    matches = EVENT_KEYWORD_PATTERN.findall(event_name.lower())
+    if not matches:
+        return 'other_crisis'
 
-    return 'other_crisis'
+    # The first type (in mapping order) with any matching keyword wins
+    return EVENT_KEYWORDS[min(KEYWORD_RANK[keyword] for keyword in matches)][1]
 
 # ============================================================================
 # CHECK HUMAID
@@ -106,7 +124,7 @@ def check_humaid():
         return None
 
     print(f"Loading: {HUMAID_PATH}")
-    df = pd.read_csv(HUMAID_PATH, low_memory=False)
+    df = read_table(HUMAID_PATH, low_memory=False)
     print(f"Loaded: {len(df):,} rows")
 
     print(f"\nCOLUMN CHECK:")
@@ -122,6 +140,8 @@ def check_humaid():
             return None
 
     events = df['event_name'].unique()
+    # Tweets per event from one hashed pass instead of one mask scan per event
+    event_counts = df['event_name'].value_counts()
     print(f"\nUNIQUE EVENTS IN HUMAID:")
     print(f"   Total unique events: {len(events)}")
 
@@ -144,13 +164,13 @@ def check_humaid():
     for event_type in sorted(type_groups.keys()):
         print(f"\n   {event_type.upper()}:")
         for event in sorted(type_groups[event_type]):
-            count = len(df[df['event_name'] == event])
+            count = event_counts[event]
             print(f"      - {event} ({count:,} tweets)")
 
     if unmapped:
         print(f"\n[WARNING] UNMAPPED EVENTS (will be labeled 'other_crisis'):")
         for event in sorted(unmapped):
-            count = len(df[df['event_name'] == event])
+            count = event_counts[event]
             print(f"      - {event} ({count:,} tweets)")
         print(f"\n   Add these to EVENT_TYPE_MAPPING if they need specific types!")
     else:
@@ -173,7 +193,7 @@ def check_crisislex():
         return None
 
     print(f"Loading: {CRISISLEX_PATH}")
-    df = pd.read_csv(CRISISLEX_PATH, low_memory=False)
+    df = read_table(CRISISLEX_PATH, low_memory=False)
     print(f"Loaded: {len(df):,} rows")
 
     print(f"\nCOLUMN CHECK:")
@@ -193,6 +213,8 @@ def check_crisislex():
             return None
 
     events = df['event_name'].unique()
+    # Tweets per event from one hashed pass instead of one mask scan per event
+    event_counts = df['event_name'].value_counts()
     print(f"\nUNIQUE EVENTS IN CRISISLEX:")
     print(f"   Total unique events: {len(events)}")
 
@@ -215,13 +237,13 @@ def check_crisislex():
     for event_type in sorted(type_groups.keys()):
         print(f"\n   {event_type.upper()}:")
         for event in sorted(type_groups[event_type]):
-            count = len(df[df['event_name'] == event])
+            count = event_counts[event]
             print(f"      - {event} ({count:,} tweets)")
 
     if unmapped:
         print(f"\n[WARNING] UNMAPPED EVENTS (will be labeled 'other_crisis'):")
         for event in sorted(unmapped):
-            count = len(df[df['event_name'] == event])
+            count = event_counts[event]
             print(f"      - {event} ({count:,} tweets)")
         print(f"\n   Add these to EVENT_TYPE_MAPPING if they need specific types!")
     else:
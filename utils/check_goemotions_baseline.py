@@ -13,7 +13,7 @@ Purpose:
     - Recommends which 13 emotions to use for crisis detection
 
 Input:
-    - goemotion_data/goemotions.csv
+    - goemotion_data/goemotions.csv (.parquet preferred if present)
     - baseline_data/baseline_noise.csv (optional)
 
 Output:
@@ -29,6 +29,11 @@ Date: January 2026
 
 import pandas as pd
 import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))  # for _tables
+from _tables import prefer_parquet, read_table
 
 print("="*80)
 print("GOEMOTIONS & BASELINE PRE-CHECK")
@@ -38,7 +43,7 @@ print("="*80)
 # CONFIGURATION
 # ============================================================================
 
-GOEMOTIONS_PATH = "./goemotion_data/goemotions.csv"
+GOEMOTIONS_PATH = prefer_parquet("./goemotion_data/goemotions.csv")
 BASELINE_PATH = "./baseline_data/baseline_noise.csv"
 
 # ============================================================================
@@ -91,7 +96,7 @@ def check_goemotions():
         return None
 
     print(f"Loading: {GOEMOTIONS_PATH}")
-    df = pd.read_csv(GOEMOTIONS_PATH)
+    df = read_table(GOEMOTIONS_PATH)
     print(f"Loaded: {len(df):,} rows")
 
     print(f"\nColumns: {list(df.columns)}")
@@ -101,16 +106,14 @@ def check_goemotions():
 
     print(f"\nAnalyzing emotion distribution...")
 
-    emotion_counts = {emotion: 0 for emotion in ALL_EMOTIONS.values()}
+    # Label arrays (Parquet) or "[2, 3]" strings (CSV): one label id per row and
+    # label, counted in a single pass; missing or unparsable labels count nothing
+    labels = df['labels']
+    if pd.api.types.is_string_dtype(labels):
+        labels = labels.str.findall(r'\d+')
+    id_counts = pd.to_numeric(labels.explode(), errors='coerce').value_counts()
 
-    for _, row in df.iterrows():
-        try:
-            labels = eval(row['labels']) if isinstance(row['labels'], str) else row['labels']
-            for label_id in labels:
-                if label_id in ALL_EMOTIONS:
-                    emotion_counts[ALL_EMOTIONS[label_id]] += 1
-        except:
-            continue
+    emotion_counts = {emotion: int(id_counts.get(label_id, 0)) for label_id, emotion in ALL_EMOTIONS.items()}
 
     print(f"\nEMOTION DISTRIBUTION (All 28 emotions):")
     print(f"{'='*80}")
@@ -30,7 +30,12 @@ Date: January 2026
 """
 
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
 import os
+import io
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
 
 print("="*70)
 print("EXPLORING NON-CRISIS DATASETS")
@@ -38,74 +43,119 @@ print("="*70)
 
 non_crisis_folder = 'non_crisis_data'
 
-dataset_info = []
-
-for root, dirs, files in os.walk(non_crisis_folder):
-    for file in files:
-        if file.endswith('.csv'):
-            file_path = os.path.join(root, file)
-            dataset_name = os.path.basename(root)
-
-            print(f"\n{'='*70}")
-            print(f"Dataset: {dataset_name}")
-            print(f"File: {file}")
-            print('='*70)
-
-            try:
-                df = pd.read_csv(file_path, nrows=5, encoding='utf-8', low_memory=False)
-                full_df = pd.read_csv(file_path, encoding='utf-8', low_memory=False)
-
-                print(f"Total rows: {len(full_df):,}")
-                print(f"Columns: {df.columns.tolist()}")
-
-                text_cols = [col for col in df.columns if 'text' in col.lower() or 'tweet' in col.lower() or 'content' in col.lower()]
-                print(f"\nText columns: {text_cols if text_cols else 'NONE FOUND'}")
-
-                time_cols = [col for col in df.columns if 'time' in col.lower() or 'date' in col.lower() or 'created' in col.lower()]
-                print(f"Timestamp columns: {time_cols if time_cols else 'NONE FOUND'}")
-
-                id_cols = [col for col in df.columns if 'id' in col.lower() and 'user' not in col.lower()]
-                print(f"ID columns: {id_cols if id_cols else 'None'}")
-
-                print(f"\nFirst row sample:")
-                print(df.iloc[0].to_dict())
-
-                dataset_info.append({
-                    'dataset': dataset_name,
-                    'file': file,
-                    'rows': len(full_df),
-                    'has_text': bool(text_cols),
-                    'has_timestamp': bool(time_cols),
-                    'has_id': bool(id_cols),
-                    'text_col': text_cols[0] if text_cols else None,
-                    'time_col': time_cols[0] if time_cols else None,
-                    'id_col': id_cols[0] if id_cols else None
-                })
-
-            except Exception as e:
-                print(f"Error reading file: {e}")
-
-# Summary table
-print(f"\n{'='*70}")
-print("SUMMARY - NON-CRISIS DATASETS")
-print('='*70)
-
-summary_df = pd.DataFrame(dataset_info)
-if not summary_df.empty:
-    print("\nDataset Overview:")
-    print(summary_df[['dataset', 'rows', 'has_text', 'has_timestamp', 'has_id']].to_string(index=False))
-
-    total_tweets = summary_df['rows'].sum()
-    print(f"\nTotal non-crisis tweets available: {total_tweets:,}")
-
-    need_extraction = summary_df[~summary_df['has_timestamp'] & summary_df['has_id']]
-    if not need_extraction.empty:
-        print(f"\nDatasets needing timestamp extraction from IDs:")
-        for _, row in need_extraction.iterrows():
-            print(f"  - {row['dataset']}")
-
-    summary_df.to_csv('non_crisis_summary.csv', index=False)
-    print(f"\nSummary saved to: non_crisis_summary.csv")
-
-else:
-    print("No datasets found!")
+def count_csv_rows(file_path):
+    """Count a CSV's data rows by streaming only its first column through pyarrow"""
+    # Rows with a different field count are still rows to pandas (short ones
+    # are padded), so they are counted here rather than failing the scan
+    ragged = []
+    def count_ragged(row):
+        ragged.append(row.number)
+        return 'skip'
+
+    # Positional names (f0, f1, ...) after skipping the header, so an unnamed
+    # first column works too; quoted newlines stay inside their row
+    reader = pacsv.open_csv(
+        file_path,
+        read_options=pacsv.ReadOptions(block_size=8 << 20, skip_rows=1, autogenerate_column_names=True),
+        parse_options=pacsv.ParseOptions(newlines_in_values=True, invalid_row_handler=count_ragged),
+        convert_options=pacsv.ConvertOptions(include_columns=['f0'], column_types={'f0': pa.string()})
+    )
+    return sum(batch.num_rows for batch in reader) + len(ragged)
+
+def describe_file(file_path):
+    """Print one CSV's structure and return its dataset_info entry (None on error)"""
+    dataset_name = os.path.basename(os.path.dirname(file_path))
+    file = os.path.basename(file_path)
+
+    print(f"\n{'='*70}")
+    print(f"Dataset: {dataset_name}")
+    print(f"File: {file}")
+    print('='*70)
+
+    try:
+        df = pd.read_csv(file_path, nrows=5, encoding='utf-8', low_memory=False)
+        n_rows = count_csv_rows(file_path)
+
+        print(f"Total rows: {n_rows:,}")
+        print(f"Columns: {df.columns.tolist()}")
+
+        text_cols = [col for col in df.columns if 'text' in col.lower() or 'tweet' in col.lower() or 'content' in col.lower()]
+        print(f"\nText columns: {text_cols if text_cols else 'NONE FOUND'}")
+
+        time_cols = [col for col in df.columns if 'time' in col.lower() or 'date' in col.lower() or 'created' in col.lower()]
+        print(f"Timestamp columns: {time_cols if time_cols else 'NONE FOUND'}")
+
+        id_cols = [col for col in df.columns if 'id' in col.lower() and 'user' not in col.lower()]
+        print(f"ID columns: {id_cols if id_cols else 'None'}")
+
+        print(f"\nFirst row sample:")
+        print(df.iloc[0].to_dict())
+
+        return {
+            'dataset': dataset_name,
+            'file': file,
+            'rows': n_rows,
+            'has_text': bool(text_cols),
+            'has_timestamp': bool(time_cols),
+            'has_id': bool(id_cols),
+            'text_col': text_cols[0] if text_cols else None,
+            'time_col': time_cols[0] if time_cols else None,
+            'id_col': id_cols[0] if id_cols else None
+        }
+
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        return None
+
+def inspect_file(file_path):
+    """Inspect one CSV, returning its dataset_info entry (None on error) and printed report"""
+    report = io.StringIO()
+    with redirect_stdout(report):
+        info = describe_file(file_path)
+    return info, report.getvalue()
+
+def limit_worker_threads():
+    """One Arrow thread per worker process; the files themselves are the parallelism"""
+    pa.set_cpu_count(1)
+
+if __name__ == "__main__":
+    csv_paths = [
+        os.path.join(root, file)
+        for root, dirs, files in os.walk(non_crisis_folder)
+        for file in files
+        if file.endswith('.csv')
+    ]
+
+    # Files are independent, so inspect them in parallel; each report is
+    # printed whole and in walk order so the output reads as before
+    dataset_info = []
+    with ProcessPoolExecutor(initializer=limit_worker_threads) as ex:
+        for info, report in ex.map(inspect_file, csv_paths):
+            print(report, end='')
+            if info is not None:
+                dataset_info.append(info)
+
+    # Summary table
+    print(f"\n{'='*70}")
+    print("SUMMARY - NON-CRISIS DATASETS")
+    print('='*70)
+
+    summary_df = pd.DataFrame(dataset_info)
+    if not summary_df.empty:
+        print("\nDataset Overview:")
+        print(summary_df[['dataset', 'rows', 'has_text', 'has_timestamp', 'has_id']].to_string(index=False))
+
+        total_tweets = summary_df['rows'].sum()
+        print(f"\nTotal non-crisis tweets available: {total_tweets:,}")
+
+        need_extraction = summary_df[~summary_df['has_timestamp'] & summary_df['has_id']]
+        if not need_extraction.empty:
+            print(f"\nDatasets needing timestamp extraction from IDs:")
+            for _, row in need_extraction.iterrows():
+                print(f"  - {row['dataset']}")
+
+        summary_df.to_csv('non_crisis_summary.csv', index=False)
+        print(f"\nSummary saved to: non_crisis_summary.csv")
+
+    else:
+        print("No datasets found!")
@@ -16,6 +16,8 @@ Input:
 
 Output:
     - Console output showing file statistics, samples, and distributions
+    - <name>.event_counts.parquet beside the CSV (event columns only; reused
+      while the CSV is unchanged, as is a full <name>.parquet sibling)
 
 Usage:
     python utils/inspect_large_dataset.py
@@ -29,7 +31,13 @@ Date: January 2026
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
 import os
+from pathlib import Path
+from collections import Counter
 
 print("="*80)
 print("LARGE DATASET INSPECTOR")
@@ -52,14 +60,83 @@ def get_file_size(filepath):
     size_mb = size_bytes / (1024 * 1024)
     return size_mb
 
-def count_rows_fast(filepath):
-    """Count rows without loading entire file into memory"""
-    print("Counting rows (this may take a moment for large files)...")
-
-    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-        row_count = sum(1 for line in f) - 1  # Subtract 1 for header
-
-    return row_count
+def count_values(column):
+    """{value: count} of an Arrow column's non-null values, counted in C++"""
+    value_counts = pc.value_counts(pc.drop_null(column))
+    return dict(zip(value_counts.field('values').to_pylist(), value_counts.field('counts').to_pylist()))
+
+def fresh_snapshot(filepath, count_cols):
+    """
+    A Parquet copy of filepath that is newer than it and holds count_cols, or None.
+    Prefers the full typed sibling the standardizers write (<name>.parquet),
+    then the counts snapshot an earlier inspection left (<name>.event_counts.parquet).
+    """
+    csv_mtime = os.path.getmtime(filepath)
+    for suffix in ('.parquet', '.event_counts.parquet'):
+        path = Path(filepath).with_suffix(suffix)
+        if path.exists() and os.path.getmtime(path) >= csv_mtime \
+                and set(count_cols) <= set(pq.read_schema(path).names):
+            return path
+    return None
+
+def read_snapshot_counts(path, count_cols):
+    """Row count (from the footer, no scan) and value Counters of count_cols from a Parquet snapshot"""
+    total_rows = pq.ParquetFile(path).metadata.num_rows
+    table = pq.read_table(path, columns=count_cols)
+    return total_rows, {col: Counter(count_values(table.column(col))) for col in count_cols}
+
+def scan_counts(filepath, header, count_cols, block_size=16 << 20):
+    """
+    Stream the CSV through pyarrow once, returning its row count and a value
+    Counter for each of count_cols (column names from `header`).
+    Only those columns are parsed; counting runs in Arrow's C++ kernels.
+    The parsed count_cols are also kept in <name>.event_counts.parquet, so
+    later inspections of an unchanged file skip the CSV (see fresh_snapshot).
+    """
+    # Positional names (f0, f1, ...) after skipping the header, so any header
+    # (even an unnamed first column) works; the first column gives the row
+    # count when there is nothing to count
+    positions = [header.index(col) for col in count_cols] or [0]
+    names = [f'f{i}' for i in positions]
+    reader = pacsv.open_csv(
+        filepath,
+        read_options=pacsv.ReadOptions(block_size=block_size, skip_rows=1, autogenerate_column_names=True),
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=names,
+            column_types={name: pa.string() for name in names},
+            strings_can_be_null=True  # empty/NA cells are missing, as in pandas
+        )
+    )
+
+    snapshot_path = Path(filepath).with_suffix('.event_counts.parquet')
+    snapshot_schema = pa.schema([(col, pa.string()) for col in count_cols])
+    # Written beside the CSV and renamed into place only once the scan is
+    # complete, so a failed scan never leaves a partial snapshot behind
+    partial_path = snapshot_path.with_name(snapshot_path.name + '.partial')
+    writer = pq.ParquetWriter(partial_path, snapshot_schema, compression='zstd') if count_cols else None
+
+    total_rows = 0
+    counts = {col: Counter() for col in count_cols}
+    try:
+        for batches_processed, batch in enumerate(reader, start=1):
+            total_rows += batch.num_rows
+            for col, name in zip(count_cols, names):
+                counts[col].update(count_values(batch.column(name)))
+            if writer is not None:
+                writer.write_batch(pa.record_batch([batch.column(name) for name in names], schema=snapshot_schema))
+            if batches_processed % 10 == 0:
+                print(f"   Processed {total_rows:,} rows...")
+    except BaseException:
+        if writer is not None:
+            writer.close()
+            partial_path.unlink()
+        raise
+
+    if writer is not None:
+        writer.close()
+        os.replace(partial_path, snapshot_path)
+    return total_rows, counts
 
 def inspect_dataset(filepath):
     """Inspect a large CSV file without loading it all into memory"""
@@ -75,17 +152,6 @@ def inspect_dataset(filepath):
     size_mb = get_file_size(filepath)
     print(f"File Size: {size_mb:.2f} MB")
 
-    total_rows = count_rows_fast(filepath)
-    print(f"Total Rows: {total_rows:,}")
-
-    excel_limit = 1_048_576
-    if total_rows > excel_limit:
-        print(f"[WARNING] EXCEEDS EXCEL LIMIT ({excel_limit:,} rows)")
-        print(f"   Overflow: {total_rows - excel_limit:,} rows won't fit in Excel")
-        print(f"   This is GOOD for ML! More data = better model")
-    else:
-        print(f"[OK] Within Excel limit ({excel_limit:,} rows)")
-
     print(f"\n{'='*80}")
     print("LOADING SAMPLE DATA (First 1000 rows for preview)")
     print(f"{'='*80}\n")
@@ -117,10 +183,12 @@ def inspect_dataset(filepath):
             print()
 
         if 'created_at' in sample_df.columns:
-            sample_df['created_at'] = pd.to_datetime(sample_df['created_at'])
+            # Parsed into a local (ISO fast path, each distinct string once); the
+            # preview below keeps showing the file's own text
+            created_at = pd.to_datetime(sample_df['created_at'], errors='coerce', format='ISO8601', cache=True)
             print(f"Date Range (in sample):")
-            print(f"   Earliest: {sample_df['created_at'].min()}")
-            print(f"   Latest: {sample_df['created_at'].max()}")
+            print(f"   Earliest: {created_at.min()}")
+            print(f"   Latest: {created_at.max()}")
             print()
 
         print(f"{'='*80}")
@@ -137,34 +205,37 @@ def inspect_dataset(filepath):
     print(f"\n{'='*80}")
     print("ESTIMATING FULL DATASET DISTRIBUTION")
     print(f"{'='*80}\n")
-    print("Loading with chunking to count by event...")
-
     try:
-        event_counts = {}
-        event_type_counts = {}
-
-        chunk_size = 100000
-        chunks_processed = 0
+        # Only the counted columns are parsed (text never is)
+        columns = list(sample_df.columns)
+        count_cols = [c for c in ('event_name', 'event_type') if c in columns]
+        snapshot = fresh_snapshot(filepath, count_cols) if count_cols else None
+        if snapshot is not None:
+            print(f"Reading counts from Parquet snapshot: {snapshot}")
+            total_rows, counts = read_snapshot_counts(snapshot, count_cols)
+        else:
+            print("Streaming with pyarrow to count rows and events in one pass...")
+            total_rows, counts = scan_counts(filepath, columns, count_cols)
+        event_counts = counts.get('event_name', Counter())
+        event_type_counts = counts.get('event_type', Counter())
 
-        for chunk in pd.read_csv(filepath, chunksize=chunk_size):
-            if 'event_name' in chunk.columns:
-                for event in chunk['event_name'].value_counts().items():
-                    event_counts[event[0]] = event_counts.get(event[0], 0) + event[1]
+        print(f"\n[OK] Full dataset analysis complete!\n")
 
-            if 'event_type' in chunk.columns:
-                for etype in chunk['event_type'].value_counts().items():
-                    event_type_counts[etype[0]] = event_type_counts.get(etype[0], 0) + etype[1]
+        print(f"Total Rows: {total_rows:,}")
 
-            chunks_processed += 1
-            if chunks_processed % 10 == 0:
-                print(f"   Processed {chunks_processed * chunk_size:,} rows...")
+        excel_limit = 1_048_576
+        if total_rows > excel_limit:
+            print(f"[WARNING] EXCEEDS EXCEL LIMIT ({excel_limit:,} rows)")
+            print(f"   Overflow: {total_rows - excel_limit:,} rows won't fit in Excel")
+            print(f"   This is GOOD for ML! More data = better model")
+        else:
+            print(f"[OK] Within Excel limit ({excel_limit:,} rows)")
 
-        print(f"\n[OK] Full dataset analysis complete!\n")
+        print()
 
         if event_counts:
             print(f"FULL DATASET - Events:")
-            event_df = pd.DataFrame(list(event_counts.items()), columns=['Event', 'Count'])
-            event_df = event_df.sort_values('Count', ascending=False)
+            event_df = pd.DataFrame(event_counts.most_common(), columns=['Event', 'Count'])
             print(event_df.to_string(index=False))
             print(f"\n   Total Events: {len(event_counts)}")
 
@@ -172,8 +243,7 @@ def inspect_dataset(filepath):
 
         if event_type_counts:
             print(f"FULL DATASET - Event Types:")
-            etype_df = pd.DataFrame(list(event_type_counts.items()), columns=['Type', 'Count'])
-            etype_df = etype_df.sort_values('Count', ascending=False)
+            etype_df = pd.DataFrame(event_type_counts.most_common(), columns=['Type', 'Count'])
             print(etype_df.to_string(index=False))
 
     except Exception as e: